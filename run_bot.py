@@ -18,6 +18,7 @@ import uvicorn
 from src.config.settings import get_settings
 from src.integrations.discord_integration import GrimeGuardiansBot
 from src.integrations.dean_bot import DeanBot
+from src.integrations.gohighlevel_integration import get_gohighlevel_integration
 from src.api.webhook_server import app as webhook_app, set_router
 from src.core.inbound_router import InboundRouter
 from src.core.email_cron import run_email_cron
@@ -94,6 +95,8 @@ async def main():
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        await get_gohighlevel_integration().aclose()
 
 
 if __name__ == "__main__":
@@ -7,13 +7,14 @@ Assistant ID: asst_7pMUbszHX2eX7awjS7wYN9JF
 import asyncio
 import json
 import logging
+from functools import lru_cache
 from typing import Dict, Optional, Any
-from datetime import datetime
+from datetime import date, datetime
 
 import openai
 
 from ..config.settings import get_settings
-from ..integrations.gohighlevel_integration import GoHighLevelIntegration
+from ..integrations.gohighlevel_integration import get_gohighlevel_integration
 from ..utils.time_utils import now_ct
 
 logger = logging.getLogger(__name__)
@@ -273,6 +274,31 @@ When presenting appointments always group by day using this format:
 Never combine appointments from different days under one header. Each day gets its own bold header. If a query spans multiple days (e.g. "this week", "Monday and Tuesday"), list each day separately in chronological order. If a day has no appointments, omit it entirely.
 """.strip()
 
+# ─── Function tool schemas added since the assistant was created ─────────────
+# Appended to each run's tools by AvaAssistant._run_tools, so they work without
+# being added in the OpenAI Platform UI (a UI-registered copy takes precedence).
+FIND_CLIENT_APPOINTMENTS_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "find_client_appointments",
+        "description": (
+            "Find a client's contact record and their appointments in one call. "
+            "Prefer this over search_contacts + search_appointments when asked about a specific client."
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Client name (full or partial)"},
+                "start_date": {"type": "string", "description": "YYYY-MM-DD, defaults to today"},
+                "end_date": {"type": "string", "description": "YYYY-MM-DD, defaults to 7 days out"},
+            },
+            "required": ["name"],
+        },
+    },
+}
+
+CODE_DEFINED_TOOLS = (FIND_CLIENT_APPOINTMENTS_TOOL,)
+
 
 class AvaAssistant:
     """
@@ -286,7 +312,8 @@ class AvaAssistant:
         self.client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
         self.assistant_id = ASSISTANT_ID
         self.threads: Dict[str, str] = {}   # channel_id -> thread_id
-        self.ghl = GoHighLevelIntegration()
+        self.ghl = get_gohighlevel_integration()
+        self._tools: Optional[list] = None  # run-level tool list, see _run_tools
 
     async def get_or_create_thread(self, channel_id: str) -> str:
         """Get existing thread or create a new one for this channel."""
@@ -331,6 +358,7 @@ class AvaAssistant:
                 thread_id=thread_id,
                 assistant_id=self.assistant_id,
                 additional_instructions=date_context,
+                tools=await self._run_tools(),
             )
 
             # Poll until complete, handling tool calls
@@ -341,6 +369,21 @@ class AvaAssistant:
             logger.error(f"Ava chat error: {e}", exc_info=True)
             return "I ran into an issue processing that. Please try again or contact Brandon directly."
 
+    async def _run_tools(self) -> list:
+        """
+        The assistant's configured tools plus CODE_DEFINED_TOOLS not already among them.
+
+        Passed as the run-level tool override (which replaces the assistant's list for
+        that run, so the configured tools are carried over). Fetched once per process.
+        """
+        if self._tools is None:
+            assistant = await self.client.beta.assistants.retrieve(self.assistant_id)
+            tools = [tool.model_dump(exclude_none=True) for tool in assistant.tools]
+            registered = {t["function"]["name"] for t in tools if t.get("type") == "function"}
+            tools.extend(t for t in CODE_DEFINED_TOOLS if t["function"]["name"] not in registered)
+            self._tools = tools
+        return self._tools
+
     async def _poll_run(self, thread_id: str, run_id: str,
                         max_polls: int = 60) -> str:
         """Poll a run until complete, handling tool calls along the way."""
@@ -386,29 +429,30 @@ class AvaAssistant:
 
     async def _handle_tool_calls(self, tool_calls) -> list:
         """Route tool calls to the appropriate handlers."""
-        outputs = []
-
-        for tool_call in tool_calls:
-            name = tool_call.function.name
-            try:
-                args = json.loads(tool_call.function.arguments)
-            except json.JSONDecodeError:
-                args = {}
+        # A run often requests several independent lookups at once (schedule + contact,
+        # say) — run them concurrently; gather keeps outputs in tool_call order
+        return list(await asyncio.gather(*(self._run_tool_call(tc) for tc in tool_calls)))
 
-            logger.info(f"Tool call: {name}({args})")
+    async def _run_tool_call(self, tool_call) -> dict:
+        """Execute one tool call; failures become an error payload for the assistant."""
+        name = tool_call.function.name
+        try:
+            args = json.loads(tool_call.function.arguments)
+        except json.JSONDecodeError:
+            args = {}
 
-            try:
-                result = await self._execute_tool(name, args)
-            except Exception as e:
-                logger.error(f"Tool {name} failed: {e}")
-                result = {"error": str(e)}
+        logger.info(f"Tool call: {name}({args})")
 
-            outputs.append({
-                "tool_call_id": tool_call.id,
-                "output": json.dumps(result),
-            })
+        try:
+            result = await self._execute_tool(name, args)
+        except Exception as e:
+            logger.error(f"Tool {name} failed: {e}")
+            result = {"error": str(e)}
 
-        return outputs
+        return {
+            "tool_call_id": tool_call.id,
+            "output": json.dumps(result),
+        }
 
     async def _execute_tool(self, name: str, args: dict) -> Any:
         """Execute a tool call and return the result."""
@@ -419,14 +463,14 @@ class AvaAssistant:
                 return {
                     "date": now_ct().strftime("%A, %B %d, %Y"),
                     "count": len(appointments),
-                    "appointments": [self._fmt_appointment(a) for a in appointments],
+                    "appointments": list(map(self._fmt_appointment, appointments)),
                 }
 
             elif name == "get_weekly_schedule":
                 appointments = await ghl.get_weeks_schedule()
                 return {
                     "count": len(appointments),
-                    "appointments": [self._fmt_appointment(a) for a in appointments],
+                    "appointments": list(map(self._fmt_appointment, appointments)),
                 }
 
             elif name == "search_appointments":
@@ -437,7 +481,7 @@ class AvaAssistant:
                 )
                 return {
                     "count": len(appointments),
-                    "appointments": [self._fmt_appointment(a) for a in appointments],
+                    "appointments": list(map(self._fmt_appointment, appointments)),
                 }
 
             elif name == "get_contact_details":
@@ -469,6 +513,34 @@ class AvaAssistant:
                     ],
                 }
 
+            elif name == "find_client_appointments":
+                # Server-side join so the model makes one tool call instead of chaining
+                # search_contacts → search_appointments and matching the results itself
+                client = (args.get("name") or args.get("query") or "").strip()
+                if not client:
+                    return {"error": "name required"}
+                contacts, appointments = await asyncio.gather(
+                    ghl.search_contacts(query=client),
+                    ghl.get_appointments(
+                        start_date=args.get("start_date"),
+                        end_date=args.get("end_date"),
+                    ),
+                )
+                contact_ids = {c.id for c in contacts}
+                needle = client.lower()
+                matched = [
+                    a for a in appointments
+                    if a.contact_id in contact_ids or needle in a.contact_name.lower()
+                ]
+                return {
+                    "contacts": [
+                        {"id": c.id, "name": c.name, "email": c.email, "phone": c.phone}
+                        for c in contacts
+                    ],
+                    "count": len(matched),
+                    "appointments": list(map(self._fmt_appointment, matched)),
+                }
+
             elif name == "get_conversations":
                 conversations = await ghl.get_conversations(limit=args.get("limit", 20))
                 return {
@@ -504,6 +576,7 @@ class AvaAssistant:
     @staticmethod
     def _fmt_appointment(apt) -> dict:
         """Serialize a GHLAppointment to a clean dict for the AI context."""
+        start = apt.start_time
         return {
             "id": apt.id,
             "title": apt.title,
@@ -511,8 +584,8 @@ class AvaAssistant:
             "phone": apt.contact_phone,
             "email": apt.contact_email,
             "address": apt.address,
-            "date": apt.start_time.strftime("%A, %B %d, %Y"),
-            "start": apt.start_time.strftime("%I:%M %p"),
+            "date": _fmt_day(start.date()),
+            "start": start.strftime("%I:%M %p"),
             "end": apt.end_time.strftime("%I:%M %p"),
             "status": apt.status,
             "service_type": apt.service_type,
@@ -521,6 +594,12 @@ class AvaAssistant:
         }
 
 
+@lru_cache(maxsize=64)
+def _fmt_day(day: date) -> str:
+    """Long-form date label — a week of appointments spans only a handful of days."""
+    return day.strftime("%A, %B %d, %Y")
+
+
 # Singleton
 _ava: Optional[AvaAssistant] = None
 
@@ -20,7 +20,7 @@ from datetime import datetime
 import openai
 
 from ..config.settings import get_settings
-from ..integrations.gohighlevel_integration import GoHighLevelIntegration
+from ..integrations.gohighlevel_integration import get_gohighlevel_integration
 from ..utils.time_utils import now_ct
 
 logger = logging.getLogger(__name__)
@@ -213,7 +213,7 @@ class DeanAssistant:
         self.client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
         self.assistant_id = settings.dean_assistant_id
         self.threads: Dict[str, str] = {}   # channel_id -> thread_id
-        self.ghl = GoHighLevelIntegration()
+        self.ghl = get_gohighlevel_integration()
 
     async def get_or_create_thread(self, channel_id: str) -> str:
         """Get existing thread or create a new one for this channel."""
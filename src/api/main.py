@@ -13,12 +13,12 @@ import uvicorn
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from ..config.settings import get_settings
 from ..integrations import get_integration_manager
 from ..agents import get_agent_manager, initialize_agent_system
+from .responses import ORJSONResponse
 from .middleware.auth import AuthMiddleware
 from .middleware.rate_limiting import RateLimitingMiddleware
 from .middleware.logging import LoggingMiddleware
@@ -118,7 +118,7 @@ app.add_middleware(AuthMiddleware)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions with proper logging."""
     logger.warning(f"HTTP {exc.status_code}: {exc.detail} - {request.url}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": True,
@@ -132,7 +132,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions with proper logging."""
     logger.error(f"Unhandled exception: {exc} - {request.url}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": True,
@@ -143,7 +143,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 # Root endpoint
-@app.get("/")
+@app.get("/", response_class=ORJSONResponse)
 async def root():
     """Root endpoint with system information."""
     return {
@@ -0,0 +1,21 @@
+"""
+Response classes shared by the API apps
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson.
+
+    Use for handlers that return plain dicts. Routes with a response_model
+    already serialize through pydantic's own JSON encoder — leave those on the
+    default class so FastAPI keeps that fast path.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
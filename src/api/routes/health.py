@@ -10,6 +10,7 @@ from pydantic import BaseModel
 
 from ...integrations import get_integration_manager
 from ...agents import get_agent_manager
+from ..responses import ORJSONResponse
 
 router = APIRouter()
 
@@ -93,7 +94,7 @@ async def detailed_health_check():
         )
 
 
-@router.get("/ready")
+@router.get("/ready", response_class=ORJSONResponse)
 async def readiness_check():
     """Readiness check for Kubernetes deployments."""
     try:
@@ -116,7 +117,7 @@ async def readiness_check():
         )
 
 
-@router.get("/live")
+@router.get("/live", response_class=ORJSONResponse)
 async def liveness_check():
     """Liveness check for Kubernetes deployments."""
     return {
@@ -5,14 +5,17 @@ posts a drafted response to Discord for Brandon's approval.
 """
 
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
 import logging
 import asyncio
+import orjson
 from typing import Optional
 
+from .responses import ORJSONResponse
+from ..integrations.gohighlevel_integration import get_gohighlevel_integration
+
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Grime Guardians Webhook Server")
+app = FastAPI(title="Grime Guardians Webhook Server", default_response_class=ORJSONResponse)
 
 # Set after Discord bot is ready — see run_bot.py
 _router = None
@@ -31,20 +34,25 @@ async def ghl_webhook(request: Request):
     Returns 200 immediately; processing happens in background.
     """
     try:
-        payload = await request.json()
+        payload = orjson.loads(await request.body())
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid JSON")
 
     logger.info(f"GHL webhook received: {list(payload.keys())}")
 
+    # AppointmentCreate / AppointmentUpdate / AppointmentDelete — Ava's cached
+    # schedule for today may now be stale
+    if str(payload.get("type", "")).startswith("Appointment"):
+        get_gohighlevel_integration().invalidate_schedule()
+
     if _router is None:
         logger.warning("Router not ready yet — webhook received but not processed.")
-        return JSONResponse({"status": "not_ready"}, status_code=503)
+        return ORJSONResponse({"status": "not_ready"}, status_code=503)
 
     # Fire and forget — don't make GHL wait for Discord/OpenAI
     asyncio.create_task(_router.handle(payload))
 
-    return JSONResponse({"status": "received"})
+    return ORJSONResponse({"status": "received"})
 
 
 @app.get("/health")
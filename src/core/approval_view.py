@@ -8,7 +8,7 @@ On denial, cancels cleanly.
 import logging
 import discord
 
-from ..integrations.gohighlevel_integration import GoHighLevelIntegration
+from ..integrations.gohighlevel_integration import get_gohighlevel_integration
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +21,7 @@ async def _send_via_ghl(
 ) -> bool:
     """Send a message through GHL and return success bool."""
     try:
-        async with GoHighLevelIntegration() as ghl:
+        async with get_gohighlevel_integration() as ghl:
             return await ghl.send_message(
                 conversation_id=conversation_id,
                 contact_id=contact_id,
@@ -13,7 +13,7 @@ import openai
 import discord
 
 from ..config.settings import get_settings
-from ..integrations.gohighlevel_integration import GoHighLevelIntegration
+from ..integrations.gohighlevel_integration import get_gohighlevel_integration
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -127,7 +127,7 @@ class InboundRouter:
         """
         import asyncio
         try:
-            async with GoHighLevelIntegration() as ghl:
+            async with get_gohighlevel_integration() as ghl:
                 conversations = []
                 for attempt in range(4):  # try up to 4x over ~6 seconds
                     if attempt > 0:
@@ -315,7 +315,7 @@ class InboundRouter:
         if not conversation_id:
             return ""
         try:
-            async with GoHighLevelIntegration() as ghl:
+            async with get_gohighlevel_integration() as ghl:
                 resp = await ghl._request(
                     "GET",
                     f"/conversations/{conversation_id}/messages",
@@ -15,6 +15,9 @@ from ..config.settings import PRICING_STRUCTURE, ADD_ONS, MODIFIERS, get_setting
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Rounding quantum for every money value — built once instead of per quantize call
+CENT = Decimal("0.01")
+
 
 class PricingEngine:
     """
@@ -111,13 +114,13 @@ class PricingEngine:
             final_price = subtotal * self.tax_multiplier
             
             # Round to 2 decimal places
-            base_price = base_price.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            room_charges = room_charges.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            bathroom_charges = bathroom_charges.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            add_on_charges = add_on_charges.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            subtotal = subtotal.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            tax_amount = tax_amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            final_price = final_price.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+            base_price = base_price.quantize(CENT, rounding=ROUND_HALF_UP)
+            room_charges = room_charges.quantize(CENT, rounding=ROUND_HALF_UP)
+            bathroom_charges = bathroom_charges.quantize(CENT, rounding=ROUND_HALF_UP)
+            add_on_charges = add_on_charges.quantize(CENT, rounding=ROUND_HALF_UP)
+            subtotal = subtotal.quantize(CENT, rounding=ROUND_HALF_UP)
+            tax_amount = tax_amount.quantize(CENT, rounding=ROUND_HALF_UP)
+            final_price = final_price.quantize(CENT, rounding=ROUND_HALF_UP)
             
             # Create detailed breakdown for audit trail
             breakdown = {
@@ -256,8 +259,8 @@ def calculate_contractor_pay(
     business_revenue = final_price * business_percentage
     
     return {
-        "cleaner_pay": cleaner_pay.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP),
-        "business_revenue": business_revenue.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP),
+        "cleaner_pay": cleaner_pay.quantize(CENT, rounding=ROUND_HALF_UP),
+        "business_revenue": business_revenue.quantize(CENT, rounding=ROUND_HALF_UP),
         "split_percentage": cleaner_percentage * Decimal("100"),
         "total_verified": cleaner_pay + business_revenue == final_price
     }
\ No newline at end of file
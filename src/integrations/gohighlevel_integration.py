@@ -6,14 +6,24 @@ Supports multi-calendar queries, hybrid contact resolution, and conversations.
 
 import asyncio
 import aiohttp
+import random
 import re
+import sys
+import time
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 import json
 
+import orjson
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
 from ..config.settings import get_settings, GHL_CALENDARS
+from ..utils.time_utils import CENTRAL, now_ct
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -25,6 +35,104 @@ GHL_BASE_URL = "https://services.leadconnectorhq.com"
 GHL_CALENDAR_VERSION = "2021-04-15"
 GHL_CONTACTS_VERSION = "2021-07-28"
 
+# Ava polls today's schedule on nearly every conversation turn — serve repeats from memory
+SCHEDULE_CACHE_TTL = 60  # seconds
+
+# The same contacts recur across calendars, days and recurring appointments — remember
+# lookups for a few minutes instead of re-fetching them on every schedule build
+CONTACT_CACHE_TTL = 300  # seconds
+CONTACT_CACHE_MAX = 1024  # entries per cache; oldest dropped first
+
+# test_connection fires four probes — reuse a passing result briefly instead of
+# re-probing on every health check. Any 401/403 afterwards drops it.
+CONNECTION_CHECK_TTL = 60  # seconds
+
+# Request-start rate limit as a token bucket: up to RATE_LIMIT_BURST requests start
+# immediately, then starts refill at RATE_LIMIT_PER_SEC. GHL allows 100 requests per
+# 10s per location, so this stays well inside it while letting a fan-out go out at once.
+RATE_LIMIT_PER_SEC = 10.0
+RATE_LIMIT_BURST = 10
+
+# Upper bound on GHL requests in flight per instance — the gathered calendar/contact
+# fan-outs would otherwise burst past GHL's rate limit and draw 429s
+MAX_CONCURRENT_REQUESTS = 8
+
+# Transient failures (429, 5xx, dropped connections) are retried with exponential
+# backoff + jitter; a server Retry-After header takes precedence when present
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 0.25  # seconds
+RETRY_MAX_DELAY = 30.0   # seconds
+
+# Error bodies are only logged — read a short prefix instead of parsing the whole payload
+ERROR_SNIPPET_BYTES = 200
+
+# Calendar config is static — order it by priority once instead of on every schedule fetch
+_CALENDARS_BY_PRIORITY = tuple(sorted(GHL_CALENDARS.values(), key=itemgetter("priority")))
+
+# Title → contact name patterns, in priority order. Each is anchored at the start so
+# the combined alternation below picks the first pattern that matches, not the leftmost.
+_TITLE_NAME_PATTERNS = (
+    r"^([A-Za-z]+(?:\s[A-Za-z]+)?)\s*[-–—]\s*\w+",                  # 'Destiny - Recurring'
+    r"^.*?(?:cleaning|service)\s+for\s+([A-Za-z\s]+?)(?:\s*[-–—]|$)",  # 'Cleaning for Sarah'
+    r"^([A-Za-z]+,\s*[A-Za-z]+)\s*[-–—]",                            # 'Smith, John - ...'
+    r"^([A-Za-z\s]+?)\s*\(",                                          # 'Sarah Johnson (...)'
+    r"^([A-Za-z]+)\s+(?:residence|house|home|property)",              # 'Smith Residence'
+    r"^([A-Z][a-z]+)",                                                # 'Destiny ...'
+)
+_TITLE_NAME_RE = re.compile("|".join(f"(?:{p})" for p in _TITLE_NAME_PATTERNS), re.IGNORECASE)
+_TITLE_NAME_FALLBACKS = tuple(re.compile(p, re.IGNORECASE) for p in _TITLE_NAME_PATTERNS)
+_NAME_STRIP_RE = re.compile(r"[^A-Za-z\s,.]")
+
+# Titles that carry no name at all, and captured fragments that are service words, not names
+_GENERIC_TITLES = frozenset({"appointment", "cleaning", "service"})
+_NON_NAME_WORDS = _GENERIC_TITLES | {"recurring"}
+
+
+# Parsed once; aiohttp uses a yarl.URL as-is. Fixed endpoints are prebuilt, ID-bearing
+# ones (/contacts/{id}, ...) are joined onto the base per call rather than cached.
+_BASE_URL = URL(GHL_BASE_URL)
+_STATIC_URLS = {
+    endpoint: _BASE_URL / endpoint.lstrip("/")
+    for endpoint in (
+        "/calendars/events", "/contacts/", "/contacts/search",
+        "/conversations/messages", "/conversations/search",
+    )
+}
+
+
+def _endpoint_url(endpoint: str) -> URL:
+    """URL for a GHL endpoint path such as '/contacts/{id}'."""
+    url = _STATIC_URLS.get(endpoint)
+    return url if url is not None else _BASE_URL / endpoint.lstrip("/")
+
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts GHL's trailing "Z" (UTC) natively from 3.11 on
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(value: str) -> datetime:
+        """Parse a GHL ISO timestamp; a trailing 'Z' is read as UTC."""
+        return datetime.fromisoformat(value[:-1] + "+00:00" if value[-1:] == "Z" else value)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Request-body serializer for the GHL session — orjson instead of stdlib json."""
+    return orjson.dumps(obj).decode()
+
+
+def _parse_ct(value: str) -> datetime:
+    """Parse an ISO date/datetime; naive values are taken as Central Time."""
+    dt = datetime.fromisoformat(value)
+    return dt if dt.tzinfo else dt.replace(tzinfo=CENTRAL)
+
+
+def _accept_title_name(raw: str) -> Optional[str]:
+    """Clean a captured title fragment; None if it's a service word, not a name."""
+    name = _NAME_STRIP_RE.sub("", raw).strip()
+    if len(name) > 1 and name.lower() not in _NON_NAME_WORDS:
+        return name.title()
+    return None
+
 
 @dataclass
 class GHLAppointment:
@@ -43,6 +151,7 @@ class GHLAppointment:
     assigned_user: str
     service_type: str
     calendar_name: str = ""
+    calendar_priority: int = 0
 
 
 @dataclass
@@ -82,7 +191,7 @@ class GoHighLevelIntegration:
     - Hybrid contact resolution: ID lookup → name search → title extraction
     """
 
-    def __init__(self):
+    def __init__(self, persistent: bool = False):
         self.api_key = settings.gohighlevel_api_key
         self.location_id = settings.gohighlevel_location_id
         self.pit_token = settings.highlevel_pit_token          # Preferred — never expires
@@ -91,17 +200,61 @@ class GoHighLevelIntegration:
         self.client_id = settings.highlevel_oauth_client_id
         self.client_secret = settings.highlevel_oauth_client_secret
 
-        # Rate limiting — 100ms between requests
-        self._last_request_time = datetime.now()
-        self._min_interval = 0.1
-
+        # Rate limiting — token bucket tracked as the time the bucket is next empty
+        # (GCRA). Each caller reserves its start time before awaiting, so concurrent
+        # requests can't all claim the same token.
+        self._next_request_at = 0.0
+        self._min_interval = 1 / RATE_LIMIT_PER_SEC
+        self._burst = RATE_LIMIT_BURST
+        # Created on first request so it binds to the running event loop (Python 3.9)
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        # Serializes OAuth refreshes — concurrent requests all see the same expired
+        # token, and the refresh token is single-use (also created on first use)
+        self._refresh_lock: Optional[asyncio.Lock] = None
+
+        # One pooled session per instance. Persistent instances (the shared singleton)
+        # keep it open across `async with` blocks so keep-alive connections, TLS and
+        # DNS lookups are reused; call aclose() on shutdown.
+        self.persistent = persistent
         self.session: Optional[aiohttp.ClientSession] = None
 
+        # Read-only header sets keyed by Version value — rebuilt only after a token refresh
+        self._headers_by_version: Dict[str, CIMultiDictProxy] = {}
+
+        # (day, monotonic fetch time, appointments) for get_todays_schedule
+        self._schedule_cache: Optional[Tuple[date, float, List[GHLAppointment]]] = None
+
+        # contact_id → (monotonic fetch time, contact) and lowercased title name →
+        # (fetch time, first match or None) for hybrid contact resolution
+        self._contacts_by_id: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._contacts_by_name: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+        # Lookups currently on the wire, keyed ("id" | "name", key) — events parsed
+        # concurrently often share a contact, and should share one request for it
+        self._contact_lookups: Dict[Tuple[str, str], asyncio.Future] = {}
+
+        # (monotonic check time, result) of the last successful test_connection
+        self._connection_check: Optional[Tuple[float, Dict[str, Any]]] = None
+
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        await self._get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if not self.persistent:
+            await self.aclose()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30),
+                json_serialize=_json_dumps,
+            )
+        return self.session
+
+    async def aclose(self):
+        """Close the pooled session. Safe to call more than once."""
         if self.session:
             await self.session.close()
             self.session = None
@@ -113,14 +266,18 @@ class GoHighLevelIntegration:
         token = self.pit_token or self.oauth_access_token or self.api_key
         return f"Bearer {token}"
 
-    def _base_headers(self, version: str) -> Dict[str, str]:
-        """Build headers required by GHL v2."""
-        return {
-            "Authorization": self._auth_header(),
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "Version": version,
-        }
+    def _base_headers(self, version: str) -> CIMultiDictProxy:
+        """Return the (cached, read-only) headers required by GHL v2."""
+        headers = self._headers_by_version.get(version)
+        if headers is None:
+            headers = CIMultiDictProxy(CIMultiDict({
+                "Authorization": self._auth_header(),
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "Version": version,
+            }))
+            self._headers_by_version[version] = headers
+        return headers
 
     # ─── HTTP ────────────────────────────────────────────────────────────────
 
@@ -148,91 +305,194 @@ class GoHighLevelIntegration:
         if not self.session:
             raise RuntimeError("Use GoHighLevelIntegration as an async context manager.")
 
-        # Rate limiting
-        elapsed = (datetime.now() - self._last_request_time).total_seconds()
-        if elapsed < self._min_interval:
-            await asyncio.sleep(self._min_interval - elapsed)
+        if self._request_slots is None:
+            self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
-        url = f"{GHL_BASE_URL}{endpoint}"
-        headers = self._base_headers(version)
-        self._last_request_time = datetime.now()
+        async with self._request_slots:
+            return await self._send(method, endpoint, version, params, data)
 
-        try:
-            async with self.session.request(
-                method, url, headers=headers, params=params, json=data
-            ) as resp:
-                body = await resp.json(content_type=None)
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        version: str,
+        params: Optional[Dict],
+        data: Optional[Dict],
+    ) -> Dict[str, Any]:
+        """
+        Rate-limited request with retries — see _request.
+
+        429s are retried for any method (the request was refused, not processed).
+        5xx responses and connection errors are only retried for GET, so a POST
+        such as send_message is never delivered twice.
+        """
+        url = _endpoint_url(endpoint)
+        idempotent = method == "GET"
+
+        for attempt in range(MAX_RETRIES + 1):
+            await self._wait_for_slot()
+            headers = self._base_headers(version)
+            sent_token = self.oauth_access_token
+            can_retry = attempt < MAX_RETRIES
 
-                if resp.status == 401:
-                    # Try refresh once
-                    if await self._refresh_token():
-                        headers["Authorization"] = self._auth_header()
+            try:
+                async with self.session.request(
+                    method, url, headers=headers, params=params, json=data
+                ) as resp:
+                    if resp.status == 401 and await self._refresh_token(sent_token):
+                        # Retry once with the refreshed token
+                        headers = self._base_headers(version)
                         async with self.session.request(
                             method, url, headers=headers, params=params, json=data
                         ) as retry:
-                            body = await retry.json(content_type=None)
                             if retry.status >= 400:
-                                logger.error(f"GHL {method} {endpoint} retry failed {retry.status}: {body}")
-                                return {"error": body, "status_code": retry.status}
-                            return body
+                                self._note_error_status(retry.status)
+                                snippet = await self._error_snippet(retry)
+                                logger.error("GHL %s %s retry failed %s: %s", method, endpoint, retry.status, snippet)
+                                return {"error": snippet, "status_code": retry.status}
+                            return await self._read_json(retry)
+
+                    transient = resp.status == 429 or (idempotent and resp.status >= 500)
+                    if not (transient and can_retry):
+                        if resp.status >= 400:
+                            self._note_error_status(resp.status)
+                            snippet = await self._error_snippet(resp)
+                            logger.error("GHL %s %s failed %s: %s", method, endpoint, resp.status, snippet)
+                            return {"error": snippet, "status_code": resp.status}
+                        return await self._read_json(resp)
+
+                    delay = self._retry_delay(attempt, resp.headers.get("Retry-After"))
+                    logger.warning(
+                        "GHL %s %s returned %s, retrying in %.2fs", method, endpoint, resp.status, delay
+                    )
+
+            except aiohttp.ClientError as e:
+                if not (idempotent and can_retry):
+                    logger.error("GHL request error %s: %s", endpoint, e)
+                    return {"error": str(e)}
+                delay = self._retry_delay(attempt)
+                logger.warning("GHL request error %s: %s, retrying in %.2fs", endpoint, e, delay)
+
+            # Sleep outside the response context so the pooled connection is released
+            await asyncio.sleep(delay)
+
+    async def _wait_for_slot(self):
+        """Take a token from the request bucket, waiting for a refill if it's empty."""
+        now = time.monotonic()
+        tat = max(now, self._next_request_at)
+        # A full bucket lets tat run up to burst-1 intervals ahead of now before anyone waits
+        slot = max(now, tat - (self._burst - 1) * self._min_interval)
+        self._next_request_at = tat + self._min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+        """Backoff before retry number attempt+1; honours a numeric Retry-After."""
+        if retry_after:
+            try:
+                return min(float(retry_after), RETRY_MAX_DELAY)
+            except ValueError:
+                pass  # HTTP-date form — fall back to backoff
+        return min(RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, 0.1), RETRY_MAX_DELAY)
 
-                if resp.status >= 400:
-                    logger.error(f"GHL {method} {endpoint} failed {resp.status}: {body}")
-                    return {"error": body, "status_code": resp.status}
+    @staticmethod
+    async def _read_json(resp: aiohttp.ClientResponse) -> Any:
+        """Parse a success body with orjson; an empty body gives None like resp.json()."""
+        raw = await resp.read()
+        return orjson.loads(raw) if raw.strip() else None
 
-                return body
+    def _note_error_status(self, status: int) -> None:
+        """Auth failures mean a cached test_connection success is no longer true."""
+        if status in (401, 403):
+            self._connection_check = None
 
-        except aiohttp.ClientError as e:
-            logger.error(f"GHL request error {endpoint}: {e}")
-            return {"error": str(e)}
+    @staticmethod
+    async def _error_snippet(resp: aiohttp.ClientResponse) -> str:
+        """Read at most ERROR_SNIPPET_BYTES of an error body for logging."""
+        raw = await resp.content.read(ERROR_SNIPPET_BYTES)
+        return raw.decode("utf-8", "replace")
 
-    async def _refresh_token(self) -> bool:
-        """Refresh OAuth access token using refresh token."""
+    async def _refresh_token(self, stale_token: Optional[str]) -> bool:
+        """
+        Refresh OAuth access token using refresh token.
+
+        Args:
+            stale_token: The access token the failed request was sent with. If another
+                request has already replaced it, no refresh is made and True is returned.
+        """
         if not self.oauth_refresh_token:
             return False
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+
+        async with self._refresh_lock:
+            if self.oauth_access_token != stale_token:
+                return True
+            return await self._post_refresh()
+
+    async def _post_refresh(self) -> bool:
+        """POST the refresh token to /oauth/token and store the rotated pair."""
         try:
-            async with aiohttp.ClientSession() as tmp:
-                async with tmp.post(
-                    "https://services.leadconnectorhq.com/oauth/token",
-                    json={
-                        "client_id": self.client_id,
-                        "client_secret": self.client_secret,
-                        "grant_type": "refresh_token",
-                        "refresh_token": self.oauth_refresh_token,
-                    },
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        self.oauth_access_token = data.get("access_token", self.oauth_access_token)
-                        self.oauth_refresh_token = data.get("refresh_token", self.oauth_refresh_token)
-                        logger.info("GHL OAuth token refreshed.")
-                        return True
-                    logger.warning(f"Token refresh failed: {resp.status}")
-                    return False
+            session = await self._get_session()
+            async with session.post(
+                "https://services.leadconnectorhq.com/oauth/token",
+                json={
+                    "client_id": self.client_id,
+                    "client_secret": self.client_secret,
+                    "grant_type": "refresh_token",
+                    "refresh_token": self.oauth_refresh_token,
+                },
+            ) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    self.oauth_access_token = data.get("access_token", self.oauth_access_token)
+                    self.oauth_refresh_token = data.get("refresh_token", self.oauth_refresh_token)
+                    self._headers_by_version.clear()
+                    logger.info("GHL OAuth token refreshed.")
+                    return True
+                logger.warning("Token refresh failed: %s", resp.status)
+                return False
         except Exception as e:
-            logger.error(f"Token refresh error: {e}")
+            logger.error("Token refresh error: %s", e)
             return False
 
     # ─── Calendar / Appointments ─────────────────────────────────────────────
 
     async def get_appointments(
         self,
-        start_date: Optional[str] = None,
-        end_date: Optional[str] = None,
+        start_date: Optional[Union[str, datetime]] = None,
+        end_date: Optional[Union[str, datetime]] = None,
     ) -> List[GHLAppointment]:
         """
         Fetch appointments across all configured GHL calendars.
 
         Args:
-            start_date: ISO date string 'YYYY-MM-DD'. Defaults to today.
-            end_date:   ISO date string 'YYYY-MM-DD'. Defaults to +7 days.
+            start_date: ISO date string 'YYYY-MM-DD' or a tz-aware datetime. Defaults to today.
+            end_date:   ISO date string 'YYYY-MM-DD' or a tz-aware datetime. Defaults to +7 days.
 
         Returns:
-            List of GHLAppointment, sorted by calendar priority then start time.
+            List of GHLAppointment in chronological order (start time).
+        """
+        appointments, _ = await self._fetch_appointments(start_date, end_date)
+        return appointments
+
+    async def _fetch_appointments(
+        self,
+        start_date: Optional[Union[str, datetime]],
+        end_date: Optional[Union[str, datetime]],
+    ) -> Tuple[List[GHLAppointment], bool]:
         """
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        start_dt = datetime.fromisoformat(start_date) if start_date else today
-        end_dt = datetime.fromisoformat(end_date) if end_date else (today + timedelta(days=7))
+        get_appointments, plus whether every calendar answered.
+
+        A calendar that errors contributes no appointments, so an incomplete
+        result must not be cached as the day's schedule.
+        """
+        # Windows are Central Time and tz-aware, so .timestamp() converts via zoneinfo
+        # rather than the platform mktime/local-tz lookup (and ignores the server's TZ)
+        today = now_ct().replace(hour=0, minute=0, second=0, microsecond=0)
+        start_dt = _parse_ct(start_date) if isinstance(start_date, str) else (start_date or today)
+        end_dt = _parse_ct(end_date) if isinstance(end_date, str) else (end_date or today + timedelta(days=7))
 
         # If end is the same as start (or has no time component), extend to end of that day
         # so a single-date query like start=2026-03-13, end=2026-03-13 captures all day's events
@@ -243,55 +503,87 @@ class GoHighLevelIntegration:
         start_ms = int(start_dt.timestamp() * 1000)
         end_ms = int(end_dt.timestamp() * 1000)
 
-        all_appointments: List[GHLAppointment] = []
-        calendars = sorted(GHL_CALENDARS.values(), key=lambda c: c["priority"])
+        # Query params shared by every calendar — only calendarId varies per request
+        base_params = {
+            "locationId": self.location_id,
+            "startTime": start_ms,
+            "endTime": end_ms,
+        }
 
-        for cal in calendars:
-            cal_id = cal["id"]
-            cal_name = cal["name"]
+        # Calendars are independent — fetch them concurrently (the rate limiter still spaces request starts)
+        per_calendar = await asyncio.gather(
+            *(self._fetch_calendar_events(cal, base_params) for cal in _CALENDARS_BY_PRIORITY)
+        )
+        complete = all(apts is not None for apts in per_calendar)
+        all_appointments = [apt for apts in per_calendar if apts for apt in apts]
 
-            params = {
-                "locationId": self.location_id,
-                "calendarId": cal_id,
-                "startTime": start_ms,
-                "endTime": end_ms,
-            }
+        all_appointments.sort(key=attrgetter("start_time"))
+        logger.info("Total appointments fetched: %s", len(all_appointments))
+        return all_appointments, complete
 
-            resp = await self._request("GET", "/calendars/events", params=params)
+    async def _fetch_calendar_events(
+        self, cal: Dict[str, Any], base_params: Dict[str, Any]
+    ) -> Optional[List[GHLAppointment]]:
+        """Fetch and parse one calendar's events; errors are logged and yield None."""
+        cal_name = cal["name"]
+        params = {**base_params, "calendarId": cal["id"]}
 
-            if "error" in resp:
-                logger.warning(f"Calendar '{cal_name}' error: {resp['error']}")
-                continue
+        resp = await self._request("GET", "/calendars/events", params=params)
 
-            events = resp.get("events", [])
-            logger.info(f"Calendar '{cal_name}': {len(events)} events")
+        if "error" in resp:
+            logger.warning("Calendar '%s' error: %s", cal_name, resp['error'])
+            return None
 
-            for event in events:
-                apt = await self._parse_event(event, cal)
-                if apt:
-                    all_appointments.append(apt)
+        events = resp.get("events", [])
+        logger.info("Calendar '%s': %s events", cal_name, len(events))
 
-        all_appointments.sort(key=lambda a: a.start_time)
-        logger.info(f"Total appointments fetched: {len(all_appointments)}")
-        return all_appointments
+        # Each event may need a contact lookup — resolve them concurrently over the pooled session
+        parsed = await asyncio.gather(*(self._parse_event(event, cal) for event in events))
+        return [apt for apt in parsed if apt]
 
     async def get_todays_schedule(self) -> List[GHLAppointment]:
-        """Get today's appointments."""
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        tomorrow = today + timedelta(days=1)
-        return await self.get_appointments(
-            today.strftime("%Y-%m-%d"),
-            tomorrow.strftime("%Y-%m-%d"),
-        )
+        """
+        Get today's appointments.
+
+        Results are cached for SCHEDULE_CACHE_TTL seconds and keyed by date, so
+        repeated polls within a conversation don't re-hit every calendar and contact.
+        A result missing a calendar (GHL error) is returned but not cached.
+        """
+        today = now_ct().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        cached = self._schedule_cache
+        if (
+            cached
+            and cached[0] == today.date()
+            and time.monotonic() - cached[1] < SCHEDULE_CACHE_TTL
+        ):
+            return list(cached[2])
+
+        appointments, complete = await self._fetch_appointments(today, today + timedelta(days=1))
+        if complete:
+            self._schedule_cache = (today.date(), time.monotonic(), appointments)
+        return list(appointments)
+
+    def invalidate_schedule(self) -> None:
+        """Drop the cached schedule — the webhook server calls this on appointment events."""
+        self._schedule_cache = None
 
     async def get_weeks_schedule(self) -> List[GHLAppointment]:
-        """Get this week's appointments (today + 6 days)."""
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        end = today + timedelta(days=7)
-        return await self.get_appointments(
-            today.strftime("%Y-%m-%d"),
-            end.strftime("%Y-%m-%d"),
-        )
+        """
+        Get this week's appointments (today + 6 days).
+
+        The week covers today too, so today's slice also refreshes the
+        get_todays_schedule cache — a follow-up "what's on today?" needs no refetch.
+        Like get_todays_schedule, only a complete fetch is cached.
+        """
+        today = now_ct().replace(hour=0, minute=0, second=0, microsecond=0)
+        appointments, complete = await self._fetch_appointments(today, today + timedelta(days=7))
+
+        if complete:
+            tomorrow = today + timedelta(days=1)
+            todays = [apt for apt in appointments if apt.start_time < tomorrow]
+            self._schedule_cache = (today.date(), time.monotonic(), todays)
+        return appointments
 
     async def _parse_event(
         self, event: Dict[str, Any], cal_config: Dict[str, Any]
@@ -304,22 +596,23 @@ class GoHighLevelIntegration:
         2. Search contacts by name extracted from title
         3. Fall back to whatever is embedded in the event
         """
+        get = event.get  # bound once — this runs for every event on every calendar
         try:
-            start_str = event.get("startTime", "")
-            end_str = event.get("endTime", "")
+            start_str = get("startTime", "")
+            end_str = get("endTime", "")
             if not start_str:
                 return None
 
-            start_time = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
+            start_time = _parse_iso(start_str)
             end_time = (
-                datetime.fromisoformat(end_str.replace("Z", "+00:00"))
+                _parse_iso(end_str)
                 if end_str
                 else start_time + timedelta(hours=2)
             )
 
-            title = event.get("title", event.get("eventTitle", "Appointment"))
-            contact_id = event.get("contactId", event.get("contact", {}).get("id", ""))
-            embedded = event.get("contact", {})
+            embedded = get("contact", {})
+            title = get("title", get("eventTitle", "Appointment"))
+            contact_id = get("contactId", embedded.get("id", ""))
 
             # Hybrid contact resolution
             contact_name, contact_email, contact_phone = await self._resolve_contact(
@@ -329,7 +622,7 @@ class GoHighLevelIntegration:
             )
 
             return GHLAppointment(
-                id=event.get("id", ""),
+                id=get("id", ""),
                 title=title,
                 start_time=start_time,
                 end_time=end_time,
@@ -337,16 +630,17 @@ class GoHighLevelIntegration:
                 contact_name=contact_name,
                 contact_email=contact_email,
                 contact_phone=contact_phone,
-                address=event.get("address", embedded.get("address1", "")),
-                status=event.get("appointmentStatus", event.get("status", "scheduled")),
-                notes=event.get("notes", event.get("description", "")),
-                assigned_user=event.get("assignedUserId", ""),
+                address=get("address", embedded.get("address1", "")),
+                status=get("appointmentStatus", get("status", "scheduled")),
+                notes=get("notes", get("description", "")),
+                assigned_user=get("assignedUserId", ""),
                 service_type=cal_config.get("focus", ""),
                 calendar_name=cal_config.get("name", ""),
+                calendar_priority=cal_config.get("priority", 0),
             )
 
         except Exception as e:
-            logger.error(f"Error parsing event {event.get('id', '?')}: {e}")
+            logger.error("Error parsing event %s: %s", get('id', '?'), e)
             return None
 
     async def _resolve_contact(
@@ -386,19 +680,41 @@ class GoHighLevelIntegration:
         )
 
     async def _get_contact_by_id(self, contact_id: str) -> Optional[Dict[str, Any]]:
-        """Direct contact lookup by ID."""
+        """Direct contact lookup by ID. Found contacts are cached for CONTACT_CACHE_TTL."""
+        hit = self._contacts_by_id.get(contact_id)
+        if hit and time.monotonic() - hit[0] < CONTACT_CACHE_TTL:
+            return hit[1]
+        return await self._coalesce(("id", contact_id), lambda: self._fetch_contact_by_id(contact_id))
+
+    async def _fetch_contact_by_id(self, contact_id: str) -> Optional[Dict[str, Any]]:
+        """GET /contacts/{id}; caches the contact on success."""
         try:
             resp = await self._request(
                 "GET", f"/contacts/{contact_id}", version=GHL_CONTACTS_VERSION
             )
             if "error" not in resp:
-                return resp.get("contact", resp)
+                contact = resp.get("contact", resp)
+                self._remember(self._contacts_by_id, contact_id, contact)
+                return contact
         except Exception as e:
-            logger.debug(f"Contact ID lookup failed for {contact_id}: {e}")
+            logger.debug("Contact ID lookup failed for %s: %s", contact_id, e)
         return None
 
     async def _search_contact_by_name(self, name: str) -> Optional[Dict[str, Any]]:
-        """Search contacts by name using the v2 search endpoint."""
+        """
+        Search contacts by name using the v2 search endpoint.
+
+        Answers (including "no match") are cached per lowercased name for
+        CONTACT_CACHE_TTL; failed requests are not.
+        """
+        key = name.lower()
+        hit = self._contacts_by_name.get(key)
+        if hit and time.monotonic() - hit[0] < CONTACT_CACHE_TTL:
+            return hit[1]
+        return await self._coalesce(("name", key), lambda: self._fetch_contact_by_name(name, key))
+
+    async def _fetch_contact_by_name(self, name: str, key: str) -> Optional[Dict[str, Any]]:
+        """POST /contacts/search; caches the first match (or None) under key."""
         try:
             resp = await self._request(
                 "POST",
@@ -410,42 +726,69 @@ class GoHighLevelIntegration:
                     "pageLimit": 3,
                 },
             )
+            if "error" in resp:
+                return None
             contacts = resp.get("contacts", [])
-            return contacts[0] if contacts else None
+            contact = contacts[0] if contacts else None
+            self._remember(self._contacts_by_name, key, contact)
+            return contact
         except Exception as e:
-            logger.debug(f"Contact name search failed for '{name}': {e}")
+            logger.debug("Contact name search failed for '%s': %s", name, e)
         return None
 
+    async def _coalesce(self, key: Tuple[str, str], fetch) -> Any:
+        """Run fetch() once for concurrent callers asking for the same lookup key."""
+        pending = self._contact_lookups.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(fetch())
+            self._contact_lookups[key] = pending
+            pending.add_done_callback(lambda _: self._contact_lookups.pop(key, None))
+        # Shielded so one caller being cancelled doesn't cancel the lookup for the rest
+        return await asyncio.shield(pending)
+
+    @staticmethod
+    def _remember(cache: Dict[str, Tuple[float, Any]], key: str, value: Any) -> None:
+        """Store a timestamped lookup result, evicting the oldest entry when full."""
+        cache.pop(key, None)  # re-insert so insertion order tracks fetch time
+        if len(cache) >= CONTACT_CACHE_MAX:
+            del cache[next(iter(cache))]
+        cache[key] = (time.monotonic(), value)
+
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _extract_name_from_title(title: str) -> str:
         """
         Extract a contact name from an appointment title.
 
+        Memoized — recurring appointments repeat the same title every week, and the
+        result depends on the title alone. cache_info() gives the hit rate.
+
         Handles patterns like:
         - 'Destiny - Recurring Cleaning' → 'Destiny'
         - 'Cleaning for Sarah Johnson' → 'Sarah Johnson'
         - 'Smith Residence Deep Clean' → 'Smith'
         """
-        if not title or title.lower() in ("appointment", "cleaning", "service"):
+        if not title or title.strip().lower() in _GENERIC_TITLES:
+            return "Unknown"
+        # Every pattern (and the first-word fallback) needs a letter — skip the regex
+        # work for titles like '123' or '--'
+        if not any(c.isalpha() for c in title):
             return "Unknown"
 
-        patterns = [
-            r"^([A-Za-z]+(?:\s[A-Za-z]+)?)\s*[-–—]\s*\w+",
-            r"(?:cleaning|service)\s+for\s+([A-Za-z\s]+?)(?:\s*[-–—]|$)",
-            r"^([A-Za-z]+,\s*[A-Za-z]+)\s*[-–—]",
-            r"^([A-Za-z\s]+?)\s*\(",
-            r"^([A-Za-z]+)\s+(?:residence|house|home|property)",
-            r"^([A-Z][a-z]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, title, re.IGNORECASE)
-            if match:
-                name = re.sub(r"[^A-Za-z\s,.]", "", match.group(1)).strip()
-                if len(name) > 1 and name.lower() not in (
-                    "cleaning", "service", "appointment", "recurring"
-                ):
-                    return name.title()
+        # One pass finds the highest-priority match; the per-pattern loop only runs
+        # when that match is rejected (e.g. 'Cleaning - ...' yields 'Cleaning').
+        match = _TITLE_NAME_RE.search(title)
+        if match:
+            name = _accept_title_name(match.group(match.lastindex))
+            if name:
+                return name
+
+            for pattern in _TITLE_NAME_FALLBACKS[match.lastindex:]:
+                match = pattern.search(title)
+                if match:
+                    name = _accept_title_name(match.group(1))
+                    if name:
+                        return name
 
         first = title.split()[0] if title.split() else ""
         return first.title() if first and first[0].isupper() and len(first) > 1 else "Unknown"
@@ -478,7 +821,7 @@ class GoHighLevelIntegration:
             "GET", "/contacts/", version=GHL_CONTACTS_VERSION, params=params
         )
         if "error" in resp:
-            logger.error(f"Contact search failed: {resp['error']}")
+            logger.error("Contact search failed: %s", resp['error'])
             return []
 
         return [self._parse_contact(c) for c in resp.get("contacts", [])]
@@ -514,25 +857,28 @@ class GoHighLevelIntegration:
             "POST", "/contacts/", version=GHL_CONTACTS_VERSION, data=body
         )
         if "error" in resp:
-            logger.error(f"Create contact failed: {resp['error']}")
+            logger.error("Create contact failed: %s", resp['error'])
             return None
+        # A cached "no match" for this name would hide the new contact
+        self._contacts_by_name.clear()
         return self._parse_contact(resp.get("contact", {}))
 
     def _parse_contact(self, data: Dict[str, Any]) -> GHLContact:
         """Parse raw GHL contact dict."""
-        created_raw = data.get("dateAdded", "")
+        get = data.get
+        created_raw = get("dateAdded", "")
         try:
-            created_at = datetime.fromisoformat(created_raw.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
+            created_at = _parse_iso(created_raw)
+        except (ValueError, TypeError, AttributeError):
             created_at = datetime.now()
 
         return GHLContact(
-            id=data.get("id", ""),
-            name=data.get("name") or f"{data.get('firstName','')} {data.get('lastName','')}".strip(),
-            email=data.get("email", ""),
-            phone=data.get("phone", ""),
-            tags=data.get("tags", []),
-            custom_fields=data.get("customFields", {}),
+            id=get("id", ""),
+            name=get("name") or f"{get('firstName','')} {get('lastName','')}".strip(),
+            email=get("email", ""),
+            phone=get("phone", ""),
+            tags=get("tags", []),
+            custom_fields=get("customFields", {}),
             created_at=created_at,
         )
 
@@ -554,35 +900,36 @@ class GoHighLevelIntegration:
             params={"locationId": self.location_id, "limit": limit},
         )
         if "error" in resp:
-            logger.error(f"Conversations fetch failed: {resp['error']}")
+            logger.error("Conversations fetch failed: %s", resp['error'])
             return []
 
-        results = []
+        # Loop-invariant lookups bound once; each conversation's .get bound per row
+        results: List[GHLConversation] = []
+        append = results.append
         for conv in resp.get("conversations", []):
             try:
-                last_msg = conv.get("lastMessage", {})
+                get = conv.get
+                last_msg = get("lastMessage", {})
                 last_msg_time_raw = last_msg.get("dateAdded", "")
                 try:
-                    last_msg_time = datetime.fromisoformat(
-                        last_msg_time_raw.replace("Z", "+00:00")
-                    )
-                except (ValueError, AttributeError):
+                    last_msg_time = _parse_iso(last_msg_time_raw)
+                except (ValueError, TypeError, AttributeError):
                     last_msg_time = datetime.now()
 
-                results.append(GHLConversation(
-                    id=conv.get("id", ""),
-                    contact_id=conv.get("contactId", ""),
-                    contact_name=conv.get("contact", {}).get("name", "Unknown"),
-                    type=conv.get("type", ""),
-                    status=conv.get("status", ""),
+                append(GHLConversation(
+                    id=get("id", ""),
+                    contact_id=get("contactId", ""),
+                    contact_name=get("contact", {}).get("name", "Unknown"),
+                    type=get("type", ""),
+                    status=get("status", ""),
                     last_message=last_msg.get("body", ""),
                     last_message_time=last_msg_time,
-                    unread_count=conv.get("unreadCount", 0),
+                    unread_count=get("unreadCount", 0),
                 ))
             except Exception as e:
-                logger.error(f"Error parsing conversation: {e}")
+                logger.error("Error parsing conversation: %s", e)
 
-        logger.info(f"Fetched {len(results)} conversations.")
+        logger.info("Fetched %s conversations.", len(results))
         return results
 
     async def get_conversation_messages(
@@ -595,7 +942,7 @@ class GoHighLevelIntegration:
             params={"limit": limit},
         )
         if "error" in resp:
-            logger.error(f"Messages fetch failed for {conversation_id}: {resp['error']}")
+            logger.error("Messages fetch failed for %s: %s", conversation_id, resp['error'])
             return []
         return resp.get("messages", [])
 
@@ -625,9 +972,9 @@ class GoHighLevelIntegration:
             data=body,
         )
         if "error" in resp:
-            logger.error(f"Send message failed for {conversation_id}: {resp['error']}")
+            logger.error("Send message failed for %s: %s", conversation_id, resp['error'])
             return False
-        logger.info(f"Message sent to conversation {conversation_id}")
+        logger.info("Message sent to conversation %s", conversation_id)
         return True
 
     # ─── Health Check ─────────────────────────────────────────────────────────
@@ -636,9 +983,17 @@ class GoHighLevelIntegration:
         """
         Verify GHL connectivity and surface any auth/endpoint issues.
 
+        A result where every probe passed against live GHL data is reused for
+        CONNECTION_CHECK_TTL seconds; anything less is never cached, and any
+        401/403 response drops the cached success.
+
         Returns:
             Dict with status, calendar count, contact count, conversation count.
         """
+        cached = self._connection_check
+        if cached and time.monotonic() - cached[0] < CONNECTION_CHECK_TTL:
+            return dict(cached[1])
+
         result: Dict[str, Any] = {
             "status": "unknown",
             "base_url": GHL_BASE_URL,
@@ -646,27 +1001,46 @@ class GoHighLevelIntegration:
             "auth_method": "oauth" if self.oauth_access_token else "api_key",
         }
 
+        def done(outcome):
+            # Re-raise a probe's failure at the point the sequential version would have hit it
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        # Query the calendars directly — get_todays_schedule may answer from its cache
+        today = now_ct().replace(hour=0, minute=0, second=0, microsecond=0)
+
         try:
+            # The four probes are independent — run them together, then report in order
+            loc, today_apts, contacts, convs = await asyncio.gather(
+                self._request("GET", f"/locations/{self.location_id}"),
+                self._fetch_appointments(today, today + timedelta(days=1)),
+                self.search_contacts(query="a"),
+                self.get_conversations(limit=5),
+                return_exceptions=True,
+            )
+
             # Test 1: location lookup
-            loc = await self._request("GET", f"/locations/{self.location_id}")
+            loc = done(loc)
             result["location_ok"] = "error" not in loc
 
             # Test 2: today's calendar
-            today_apts = await self.get_todays_schedule()
-            result["calendar_ok"] = True
+            today_apts, result["calendar_ok"] = done(today_apts)
             result["todays_appointments"] = len(today_apts)
 
             # Test 3: contacts
-            contacts = await self.search_contacts(query="a")
+            contacts = done(contacts)
             result["contacts_ok"] = isinstance(contacts, list)
             result["sample_contacts"] = len(contacts)
 
             # Test 4: conversations
-            convs = await self.get_conversations(limit=5)
+            convs = done(convs)
             result["conversations_ok"] = isinstance(convs, list)
             result["sample_conversations"] = len(convs)
 
             result["status"] = "success" if result.get("location_ok") else "partial"
+            if all(result[k] for k in ("location_ok", "calendar_ok", "contacts_ok", "conversations_ok")):
+                self._connection_check = (time.monotonic(), dict(result))
 
         except Exception as e:
             result["status"] = "error"
@@ -684,5 +1058,5 @@ def get_gohighlevel_integration() -> GoHighLevelIntegration:
     """Get singleton GoHighLevel integration instance."""
     global _ghl
     if _ghl is None:
-        _ghl = GoHighLevelIntegration()
+        _ghl = GoHighLevelIntegration(persistent=True)
     return _ghl
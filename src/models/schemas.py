@@ -1,28 +1,42 @@
 """
 Pydantic schemas for data validation and API responses
 Following 12-factor methodology with structured outputs
+Money (prices, pay, revenue) is Decimal; rates, scores and percentages are float
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from decimal import Decimal
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
-from .types import ServiceType, MessageType, JobStatus, ViolationType, ContractorStatus
+from .types import (
+    ServiceType, ServiceTypeValue, MessageType, JobStatusValue, ViolationType, ContractorStatus,
+)
+
+
+VALID_ADD_ONS = frozenset({
+    "fridge_interior", "oven_interior", "cabinet_interior", "garage_cleaning", "carpet_shampooing",
+})
 
 
 class BaseSchema(BaseModel):
     """Base schema with common configuration."""
-    
-    class Config:
-        use_enum_values = True
-        validate_assignment = True
-        arbitrary_types_allowed = True
+
+    # Native v2 config — the v1 inner `class Config` goes through pydantic's
+    # deprecation shim every time a schema class is built. defer_build postpones
+    # core-schema compilation to first use, so importing this module stays cheap
+    # for processes that only touch a few schemas.
+    model_config = ConfigDict(
+        use_enum_values=True,
+        validate_assignment=True,
+        arbitrary_types_allowed=True,
+        defer_build=True,
+    )
 
 
 class PricingRequest(BaseSchema):
     """Request schema for pricing calculations."""
-    service_type: ServiceType
+    service_type: ServiceTypeValue
     rooms: int = Field(ge=0, le=20)
     full_baths: int = Field(ge=0, le=10) 
     half_baths: int = Field(ge=0, le=10)
@@ -30,15 +44,17 @@ class PricingRequest(BaseSchema):
     pet_homes: bool = False
     buildup: bool = False
     add_ons: Optional[List[str]] = None
+
+    model_config = ConfigDict(frozen=True)
     
-    @validator('add_ons')
+    @field_validator('add_ons', mode='after')
+    @classmethod
     def validate_add_ons(cls, v):
         if v is None:
             return []
-        valid_add_ons = ["fridge_interior", "oven_interior", "cabinet_interior", "garage_cleaning", "carpet_shampooing"]
-        for add_on in v:
-            if add_on not in valid_add_ons:
-                raise ValueError(f"Invalid add-on: {add_on}")
+        invalid = set(v) - VALID_ADD_ONS
+        if invalid:
+            raise ValueError(f"Invalid add-on(s): {', '.join(sorted(invalid))}")
         return v
 
 
@@ -54,11 +70,8 @@ class PricingResponse(BaseSchema):
     tax_amount: Decimal
     final_price: Decimal
     breakdown: Dict[str, Any]
-    
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: float(v)
-        }
+
+    model_config = ConfigDict(frozen=True, json_encoders={Decimal: lambda v: float(v)})
 
 
 class AgentMessageSchema(BaseSchema):
@@ -72,6 +85,8 @@ class AgentMessageSchema(BaseSchema):
     contractor_id: Optional[str] = None
     context: Optional[Dict[str, Any]] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class AgentResponse(BaseSchema):
     """Schema for agent responses."""
@@ -104,8 +119,8 @@ class ContractorSchema(BaseSchema):
 class JobSchema(BaseSchema):
     """Schema for job information."""
     id: str
-    service_type: ServiceType
-    status: JobStatus
+    service_type: ServiceTypeValue
+    status: JobStatusValue
     client_name: str
     client_phone: Optional[str] = None
     client_email: Optional[str] = None
@@ -118,7 +133,7 @@ class JobSchema(BaseSchema):
     contractor_id: Optional[str] = None
     photos_submitted: bool = False
     checklist_completed: bool = False
-    quality_score: Optional[Decimal] = Field(None, ge=0, le=10)
+    quality_score: Optional[float] = Field(None, ge=0, le=10)
     special_instructions: Optional[str] = None
 
 
@@ -130,20 +145,22 @@ class ComplianceResult(BaseSchema):
     strike_count: int = Field(ge=0, le=3)
     photos_valid: bool
     checklist_complete: bool
-    compliance_score: Decimal = Field(ge=0, le=100)
+    compliance_score: float = Field(ge=0, le=100)
     recommendations: List[str] = []
     requires_human_review: bool = False
 
+    model_config = ConfigDict(frozen=True)
+
 
 class PerformanceMetrics(BaseSchema):
     """Schema for contractor performance metrics."""
     contractor_id: str
     week_ending: datetime
-    checklist_compliance_rate: Decimal = Field(ge=0, le=100)
-    photo_submission_rate: Decimal = Field(ge=0, le=100)
-    on_time_percentage: Decimal = Field(ge=0, le=100)
-    average_quality_score: Optional[Decimal] = Field(None, ge=0, le=10)
-    customer_satisfaction: Optional[Decimal] = Field(None, ge=0, le=10)
+    checklist_compliance_rate: float = Field(ge=0, le=100)
+    photo_submission_rate: float = Field(ge=0, le=100)
+    on_time_percentage: float = Field(ge=0, le=100)
+    average_quality_score: Optional[float] = Field(None, ge=0, le=10)
+    customer_satisfaction: Optional[float] = Field(None, ge=0, le=10)
     jobs_completed: int = Field(ge=0)
     total_revenue_generated: Decimal = Field(ge=0)
     violation_count: int = Field(ge=0)
@@ -160,6 +177,8 @@ class QualityViolationSchema(BaseSchema):
     penalty_amount: Optional[Decimal] = None
     requires_approval: bool = True
 
+    model_config = ConfigDict(frozen=True)
+
 
 class HumanApprovalRequest(BaseSchema):
     """Schema for human approval requests."""
@@ -173,6 +192,8 @@ class HumanApprovalRequest(BaseSchema):
     created_at: datetime
     requires_response_by: Optional[datetime] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class KPISnapshot(BaseSchema):
     """Schema for KPI dashboard snapshots."""
@@ -180,9 +201,9 @@ class KPISnapshot(BaseSchema):
     jobs_completed_today: int
     active_contractors: int
     average_completion_time: Optional[int]  # minutes
-    checklist_compliance_rate: Decimal
-    photo_submission_rate: Decimal
-    customer_satisfaction_score: Optional[Decimal]
+    checklist_compliance_rate: float
+    photo_submission_rate: float
+    customer_satisfaction_score: Optional[float]
     revenue_today: Decimal
     revenue_month_to_date: Decimal
     violations_today: int
@@ -195,10 +216,10 @@ class AgentHealthStatus(BaseSchema):
     status: str
     last_activity: datetime
     messages_processed_today: int
-    success_rate: Decimal = Field(ge=0, le=100)
+    success_rate: float = Field(ge=0, le=100)
     average_response_time: Optional[float]  # seconds
     error_count: int = 0
-    uptime_percentage: Decimal = Field(ge=0, le=100)
+    uptime_percentage: float = Field(ge=0, le=100)
 
 
 class BusinessContext(BaseSchema):
@@ -4,7 +4,7 @@ Following business rules from CLAUDE.md
 """
 
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Literal
 
 
 class ServiceType(str, Enum):
@@ -29,6 +29,11 @@ class ServiceType(str, Enum):
     ESTATE_PROTOCOL = "estate_protocol"
 
 
+# Literal mirror of ServiceType for schema fields — pydantic-core validates it with a
+# plain string-set match instead of an enum lookup. Built from the enum so the two never drift.
+ServiceTypeValue = Literal[tuple(s.value for s in ServiceType)]
+
+
 class MessageType(str, Enum):
     """Agent message types for classification."""
     JOB_ASSIGNMENT = "job_assignment"
@@ -54,6 +59,9 @@ class JobStatus(str, Enum):
     REWORK_REQUIRED = "rework_required"
 
 
+JobStatusValue = Literal[tuple(s.value for s in JobStatus)]
+
+
 class ViolationType(str, Enum):
     """Quality violation types for 3-strike system."""
     MISSING_PHOTOS = "missing_photos"
@@ -97,7 +97,7 @@ class DiscordToolkit:
             
             @self.bot.event
             async def on_ready():
-                logger.info(f"Discord bot logged in as {self.bot.user}")
+                logger.info("Discord bot logged in as %s", self.bot.user)
                 self.guild = self.bot.get_guild(guild_id)
                 
                 if self.guild:
@@ -109,7 +109,7 @@ class DiscordToolkit:
                     
                     logger.info("Discord toolkit ready")
                 else:
-                    logger.error(f"Could not find guild with ID {guild_id}")
+                    logger.error("Could not find guild with ID %s", guild_id)
             
             # Start bot in background
             asyncio.create_task(self.bot.start(bot_token))
@@ -123,7 +123,7 @@ class DiscordToolkit:
             return self.is_ready
             
         except Exception as e:
-            logger.error(f"Discord initialization error: {e}")
+            logger.error("Discord initialization error: %s", e)
             return False
     
     async def _map_channels(self) -> None:
@@ -136,7 +136,7 @@ class DiscordToolkit:
                 if channel_type.value.lstrip('🔥❌🚨✔️📸🪧💬👔📢') in channel_name:
                     self.channel_map[channel_type] = channel
                     self.channels[channel_type.value] = channel
-                    logger.info(f"Mapped channel: {channel_name} -> {channel_type.value}")
+                    logger.info("Mapped channel: %s -> %s", channel_name, channel_type.value)
     
     async def _process_message_queue(self) -> None:
         """Process queued messages when bot becomes ready."""
@@ -180,7 +180,7 @@ class DiscordToolkit:
             }
             
         except Exception as e:
-            logger.error(f"Error sending Discord message: {e}")
+            logger.error("Error sending Discord message: %s", e)
             return {
                 "status": "error",
                 "error": str(e)
@@ -191,7 +191,7 @@ class DiscordToolkit:
         try:
             channel = self.channels.get(discord_message.channel)
             if not channel:
-                logger.error(f"Channel not found: {discord_message.channel}")
+                logger.error("Channel not found: %s", discord_message.channel)
                 return None
             
             # Send message
@@ -208,7 +208,7 @@ class DiscordToolkit:
             return sent_message
             
         except Exception as e:
-            logger.error(f"Internal message send error: {e}")
+            logger.error("Internal message send error: %s", e)
             return None
     
     async def _prepare_files(self, file_paths: List[str]) -> List[discord.File]:
@@ -218,7 +218,7 @@ class DiscordToolkit:
             try:
                 files.append(discord.File(file_path))
             except Exception as e:
-                logger.warning(f"Could not prepare file {file_path}: {e}")
+                logger.warning("Could not prepare file %s: %s", file_path, e)
         return files
     
     # Business workflow tools
@@ -336,7 +336,7 @@ class DiscordToolkit:
                 message = await channel.fetch_message(result['message_id'])
                 await message.add_reaction('✅')
             except Exception as e:
-                logger.warning(f"Could not add reaction to job posting: {e}")
+                logger.warning("Could not add reaction to job posting: %s", e)
         
         return result
     
@@ -12,14 +12,12 @@ Verifies:
 import asyncio
 import sys
 import importlib.util
+from functools import lru_cache
 from pathlib import Path
 
 ROOT = Path(__file__).parent
 sys.path.insert(0, str(ROOT))
 
-from dotenv import load_dotenv
-load_dotenv()
-
 
 def _load_direct(rel_path: str):
     """Load a module by file path, bypassing package __init__.py chains."""
@@ -30,74 +28,117 @@ def _load_direct(rel_path: str):
     return mod
 
 
-# Load settings first (no problematic deps)
-settings_mod = _load_direct("src/config/settings.py")
-GHL_CALENDARS = settings_mod.GHL_CALENDARS
+@lru_cache(maxsize=1)
+def _ghl():
+    """
+    Load .env, settings and the GHL integration on first use.
+
+    Deferred so that importing this file (e.g. during pytest collection of the
+    repo root) doesn't parse .env or pull in the integration.
+
+    Returns:
+        (GHL_CALENDARS, GoHighLevelIntegration)
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    # Load settings first (no problematic deps)
+    settings_mod = _load_direct("src/config/settings.py")
 
-# Load GHL integration directly (skips discord/db imports in __init__.py)
-ghl_mod = _load_direct("src/integrations/gohighlevel_integration.py")
-GoHighLevelIntegration = ghl_mod.GoHighLevelIntegration
+    # Load GHL integration directly (skips discord/db imports in __init__.py)
+    ghl_mod = _load_direct("src/integrations/gohighlevel_integration.py")
+    return settings_mod.GHL_CALENDARS, ghl_mod.GoHighLevelIntegration
 
 
 async def main():
+    GHL_CALENDARS, GoHighLevelIntegration = _ghl()
+
     print("\n" + "=" * 60)
     print("  GHL v2 Connection Test — Grime Guardians")
     print("=" * 60)
 
     async with GoHighLevelIntegration() as ghl:
 
+        # The four probes are independent — fire them together and report in order.
+        # The integration spaces request starts, so this stays within GHL rate limits.
+        loc, today_apts, contacts, convs = await asyncio.gather(
+            ghl._request("GET", f"/locations/{ghl.location_id}"),
+            ghl.get_todays_schedule(),
+            ghl.search_contacts(query="a"),
+            ghl.get_conversations(limit=5),
+            return_exceptions=True,
+        )
+
+        # Collect the report and write it in one go instead of a print() per line
+        out = []
+        w = out.append
+
         # ── 1. Location ──────────────────────────────────────────────
-        print("\n[1] Location lookup...")
-        loc = await ghl._request("GET", f"/locations/{ghl.location_id}")
-        if "error" in loc:
-            print(f"  ❌ FAILED: {loc['error']}")
-            print("     → Check HIGHLEVEL_API_KEY and HIGHLEVEL_LOCATION_ID in .env")
+        w("\n[1] Location lookup...")
+        if isinstance(loc, Exception):
+            w(f"  ❌ FAILED: {loc}")
+        elif "error" in loc:
+            w(f"  ❌ FAILED: {loc['error']}")
+            w("     → Check HIGHLEVEL_API_KEY and HIGHLEVEL_LOCATION_ID in .env")
         else:
             name = loc.get("location", loc).get("name", "Unknown")
-            print(f"  ✅ Location: {name}")
+            w(f"  ✅ Location: {name}")
 
         # ── 2. Calendars ─────────────────────────────────────────────
-        print(f"\n[2] Calendar check ({len(GHL_CALENDARS)} calendars configured)...")
-        for key, cal in GHL_CALENDARS.items():
-            print(f"  Querying '{cal['name']}' (ID: {cal['id']})...")
-            apts = await ghl.get_todays_schedule()
-            # Already logged per-calendar inside get_todays_schedule; just show total
-            break  # get_todays_schedule queries all calendars in one call
-
-        print("\n  Fetching today's schedule across all calendars...")
-        today_apts = await ghl.get_todays_schedule()
-        if today_apts:
-            print(f"  ✅ {len(today_apts)} appointment(s) today:")
-            for apt in today_apts:
-                print(f"     • {apt.start_time.strftime('%I:%M %p')} — {apt.title} | {apt.contact_name} | {apt.calendar_name}")
+        w(f"\n[2] Calendar check ({len(GHL_CALENDARS)} calendars configured)...")
+        if isinstance(today_apts, Exception):
+            w(f"  ❌ FAILED: {today_apts}")
         else:
-            print("  ℹ️  No appointments today (calendar accessible, just empty)")
+            # get_todays_schedule already queried every calendar — split its result per calendar
+            for cal in GHL_CALENDARS.values():
+                count = sum(1 for apt in today_apts if apt.calendar_name == cal["name"])
+                w(f"  • '{cal['name']}' (ID: {cal['id']}): {count} today")
+
+            if today_apts:
+                w(f"  ✅ {len(today_apts)} appointment(s) today:")
+                for apt in today_apts:
+                    w(f"     • {apt.start_time.strftime('%I:%M %p')} — {apt.title} | {apt.contact_name} | {apt.calendar_name}")
+            else:
+                w("  ℹ️  No appointments today (calendar accessible, just empty)")
 
         # ── 3. Contacts ──────────────────────────────────────────────
-        print("\n[3] Contact search...")
-        contacts = await ghl.search_contacts(query="a")
-        if contacts:
-            print(f"  ✅ {len(contacts)} contact(s) returned (sample query)")
-            print(f"     First: {contacts[0].name} | {contacts[0].phone}")
+        w("\n[3] Contact search...")
+        if isinstance(contacts, Exception):
+            w(f"  ❌ FAILED: {contacts}")
+        elif contacts:
+            w(f"  ✅ {len(contacts)} contact(s) returned (sample query)")
+            w(f"     First: {contacts[0].name} | {contacts[0].phone}")
         else:
-            print("  ⚠️  No contacts returned — check HIGHLEVEL_LOCATION_ID or API scopes")
+            w("  ⚠️  No contacts returned — check HIGHLEVEL_LOCATION_ID or API scopes")
 
         # ── 4. Conversations ─────────────────────────────────────────
-        print("\n[4] Conversations (for Emma/CXO)...")
-        convs = await ghl.get_conversations(limit=5)
-        if convs:
-            print(f"  ✅ {len(convs)} conversation(s) fetched")
+        w("\n[4] Conversations (for Emma/CXO)...")
+        if isinstance(convs, Exception):
+            w(f"  ❌ FAILED: {convs}")
+        elif convs:
+            w(f"  ✅ {len(convs)} conversation(s) fetched")
             for c in convs[:3]:
-                print(f"     • {c.contact_name} [{c.type}] — \"{c.last_message[:60]}\"")
+                w(f"     • {c.contact_name} [{c.type}] — \"{c.last_message[:60]}\"")
         else:
-            print("  ⚠️  No conversations returned")
+            w("  ⚠️  No conversations returned")
 
         # ── Summary ──────────────────────────────────────────────────
-        print("\n" + "=" * 60)
-        print("  Done. If location + calendar show ✅, Ava is connected.")
-        print("  If you see ❌, check your API key / OAuth token in .env")
-        print("=" * 60 + "\n")
+        w("\n" + "=" * 60)
+        w("  Done. If location + calendar show ✅, Ava is connected.")
+        w("  If you see ❌, check your API key / OAuth token in .env")
+        w("=" * 60 + "\n")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop ships with uvicorn[standard] on Linux/macOS; fall back to the stock loop
+    # elsewhere, and on uvloop < 0.18, which has no uvloop.run()
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    if hasattr(uvloop, "run"):
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -0,0 +1,190 @@
+"""
+Unit tests for Ava's Assistants API tool handling
+GHL and OpenAI are stubbed — these cover tool routing and result shaping only
+"""
+
+import asyncio
+import json
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from src.agents.ava_assistant import AvaAssistant, FIND_CLIENT_APPOINTMENTS_TOOL
+from src.integrations.gohighlevel_integration import GHLAppointment, GHLContact
+
+
+class _FakeGHL:
+    """GHL stand-in usable as `async with self.ghl as ghl`."""
+
+    def __init__(self, contacts=None, appointments=None):
+        self.search_contacts = AsyncMock(return_value=contacts or [])
+        self.get_appointments = AsyncMock(return_value=appointments or [])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _ava(ghl=None, client=None) -> AvaAssistant:
+    """Build an AvaAssistant without an OpenAI key."""
+    ava = AvaAssistant.__new__(AvaAssistant)
+    ava.client = client
+    ava.assistant_id = "asst_test"
+    ava.threads = {}
+    ava.ghl = ghl or _FakeGHL()
+    ava._tools = None
+    return ava
+
+
+def _contact(contact_id: str, name: str) -> GHLContact:
+    return GHLContact(
+        id=contact_id, name=name, email="", phone="", tags=[], custom_fields={},
+        created_at=datetime(2026, 3, 1),
+    )
+
+
+def _appointment(apt_id: str, contact_id: str, contact_name: str) -> GHLAppointment:
+    start = datetime(2026, 3, 13, 9, 0)
+    return GHLAppointment(
+        id=apt_id, title="Cleaning", start_time=start, end_time=start,
+        contact_id=contact_id, contact_name=contact_name, contact_phone="", contact_email="",
+        address="", status="confirmed", notes="", assigned_user="", service_type="",
+    )
+
+
+class TestFindClientAppointments:
+    """Test the combined contact + appointment lookup tool."""
+
+    @pytest.mark.asyncio
+    async def test_matches_by_contact_id_or_name(self):
+        """Appointments match a found contact's id, or the name on the appointment."""
+        ghl = _FakeGHL(
+            contacts=[_contact("c1", "Destiny Smith")],
+            appointments=[
+                _appointment("a1", "c1", "D. Smith"),
+                _appointment("a2", "", "Destiny"),
+                _appointment("a3", "c9", "Sarah Johnson"),
+            ],
+        )
+
+        result = await _ava(ghl)._execute_tool(
+            "find_client_appointments", {"name": "Destiny", "start_date": "2026-03-13"}
+        )
+
+        assert [c["id"] for c in result["contacts"]] == ["c1"]
+        assert [a["id"] for a in result["appointments"]] == ["a1", "a2"]
+        assert result["count"] == 2
+        ghl.search_contacts.assert_awaited_once_with(query="Destiny")
+        ghl.get_appointments.assert_awaited_once_with(start_date="2026-03-13", end_date=None)
+
+    @pytest.mark.asyncio
+    async def test_no_contact_found(self):
+        """With no contact match, only name matches on appointments are returned."""
+        ghl = _FakeGHL(appointments=[_appointment("a1", "c9", "Sarah Johnson")])
+
+        result = await _ava(ghl)._execute_tool("find_client_appointments", {"name": "Destiny"})
+
+        assert result == {"contacts": [], "count": 0, "appointments": []}
+
+    @pytest.mark.asyncio
+    async def test_name_required(self):
+        """A blank name is rejected without touching GHL."""
+        ghl = _FakeGHL()
+
+        result = await _ava(ghl)._execute_tool("find_client_appointments", {"name": "  "})
+
+        assert result == {"error": "name required"}
+        ghl.search_contacts.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_ghl_failure_becomes_error_output(self):
+        """A failing lookup is reported to the assistant as an error payload."""
+        ghl = _FakeGHL()
+        ghl.get_appointments.side_effect = RuntimeError("GHL down")
+        call = SimpleNamespace(
+            id="call_1",
+            function=SimpleNamespace(name="find_client_appointments", arguments='{"name": "Destiny"}'),
+        )
+
+        output = await _ava(ghl)._run_tool_call(call)
+
+        assert output["tool_call_id"] == "call_1"
+        assert json.loads(output["output"]) == {"error": "GHL down"}
+
+
+class _FakeTool:
+    """Pydantic tool-object stand-in from assistants.retrieve."""
+
+    def __init__(self, data: dict):
+        self._data = data
+
+    def model_dump(self, **kwargs) -> dict:
+        return self._data
+
+
+class TestRunTools:
+    """Test the run-level tool list sent with each run."""
+
+    @staticmethod
+    def _client(tools):
+        assistant = SimpleNamespace(tools=[_FakeTool(t) for t in tools])
+        retrieve = AsyncMock(return_value=assistant)
+        return SimpleNamespace(beta=SimpleNamespace(assistants=SimpleNamespace(retrieve=retrieve)))
+
+    @pytest.mark.asyncio
+    async def test_code_tools_appended_once(self):
+        """Configured tools are kept, code-defined ones added; the assistant is fetched once."""
+        existing = {"type": "function", "function": {"name": "get_todays_schedule"}}
+        client = self._client([existing])
+        ava = _ava(client=client)
+
+        tools = await ava._run_tools()
+        await ava._run_tools()
+
+        assert tools == [existing, FIND_CLIENT_APPOINTMENTS_TOOL]
+        client.beta.assistants.retrieve.assert_awaited_once_with("asst_test")
+
+    @pytest.mark.asyncio
+    async def test_ui_registered_tool_not_duplicated(self):
+        """A tool already registered in the Platform UI is not sent twice."""
+        registered = {"type": "function", "function": {"name": "find_client_appointments"}}
+
+        tools = await _ava(client=self._client([registered]))._run_tools()
+
+        assert tools == [registered]
+
+
+class TestToolCallBatch:
+    """Test concurrent handling of a run's tool calls."""
+
+    @staticmethod
+    def _call(call_id: str, name: str, arguments: str = "{}"):
+        return SimpleNamespace(id=call_id, function=SimpleNamespace(name=name, arguments=arguments))
+
+    @pytest.mark.asyncio
+    async def test_outputs_keep_call_order_when_one_fails(self):
+        """Each output stays paired with its tool_call_id; a failure doesn't drop the others."""
+        ava = _ava()
+        release = asyncio.Event()
+
+        async def fake_execute(name, args):
+            if name == "slow":
+                await asyncio.wait_for(release.wait(), timeout=1)
+                return {"value": "slow"}
+            if name == "broken":
+                raise RuntimeError("boom")
+            release.set()
+            return {"value": name}
+
+        ava._execute_tool = fake_execute
+        calls = [self._call("call_1", "slow"), self._call("call_2", "broken"), self._call("call_3", "fast")]
+
+        outputs = await ava._handle_tool_calls(calls)
+
+        assert [o["tool_call_id"] for o in outputs] == ["call_1", "call_2", "call_3"]
+        assert [json.loads(o["output"]) for o in outputs] == [
+            {"value": "slow"}, {"error": "boom"}, {"value": "fast"},
+        ]
@@ -0,0 +1,814 @@
+"""
+Unit tests for the GoHighLevel v2 integration
+Network calls are stubbed — these cover caching and parsing logic only
+"""
+
+import asyncio
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+from src.integrations import gohighlevel_integration as ghl_mod
+from src.integrations.gohighlevel_integration import GHLAppointment, GoHighLevelIntegration
+
+
+def _use_calendars(monkeypatch, calendars: dict):
+    """Swap in a calendar config, ordered the way the module orders GHL_CALENDARS."""
+    monkeypatch.setattr(
+        ghl_mod, "_CALENDARS_BY_PRIORITY", tuple(sorted(calendars.values(), key=lambda c: c["priority"]))
+    )
+
+
+class _FakeContent:
+    """Stand-in for aiohttp's StreamReader."""
+
+    def __init__(self, raw: bytes):
+        self._raw = raw
+
+    async def read(self, n: int = -1) -> bytes:
+        return self._raw if n < 0 else self._raw[:n]
+
+
+class _FakeResponse:
+    """Minimal aiohttp response stand-in."""
+
+    def __init__(self, status: int = 200, body: dict = None, headers: dict = None):
+        self.status = status
+        self._body = body if body is not None else {}
+        self.headers = headers or {}
+        self.content = _FakeContent(json.dumps(self._body).encode())
+
+    async def json(self, **kwargs):
+        return self._body
+
+    async def read(self) -> bytes:
+        return json.dumps(self._body).encode()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    """Records requests and replays queued responses (default: 200 {})."""
+
+    def __init__(self, responses=None):
+        self.calls = []
+        self._responses = list(responses or [])
+        self.closed = False
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self._responses.pop(0) if self._responses else _FakeResponse()
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    async def close(self):
+        self.closed = True
+
+
+def _appointment(title: str = "Destiny - Recurring Cleaning") -> GHLAppointment:
+    """Build a minimal appointment for cache tests."""
+    now = datetime.now()
+    return GHLAppointment(
+        id="apt1", title=title, start_time=now, end_time=now,
+        contact_id="", contact_name="Destiny", contact_phone="", contact_email="",
+        address="", status="confirmed", notes="", assigned_user="", service_type="",
+    )
+
+
+class TestScheduleCache:
+    """Test the TTL cache in front of get_todays_schedule."""
+
+    def setup_method(self):
+        """Set up an integration with a stubbed, complete appointment fetch."""
+        self.ghl = GoHighLevelIntegration()
+        self.ghl._fetch_appointments = AsyncMock(return_value=([_appointment()], True))
+
+    @pytest.mark.asyncio
+    async def test_repeat_calls_hit_cache(self):
+        """Second call within the TTL does not re-query calendars."""
+        first = await self.ghl.get_todays_schedule()
+        second = await self.ghl.get_todays_schedule()
+
+        assert first == second
+        assert self.ghl._fetch_appointments.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_refetches(self, monkeypatch):
+        """Entries older than the TTL are refreshed."""
+        await self.ghl.get_todays_schedule()
+        monkeypatch.setattr(ghl_mod, "SCHEDULE_CACHE_TTL", 0)
+        await self.ghl.get_todays_schedule()
+
+        assert self.ghl._fetch_appointments.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_schedule(self):
+        """invalidate_schedule forces the next call to re-query."""
+        await self.ghl.get_todays_schedule()
+        self.ghl.invalidate_schedule()
+        await self.ghl.get_todays_schedule()
+
+        assert self.ghl._fetch_appointments.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_week_fetch_seeds_todays_schedule(self):
+        """Today's slice of a weekly fetch is served without another query."""
+        today = ghl_mod.now_ct().replace(hour=9, minute=0, second=0, microsecond=0)
+        todays, later = _appointment(), _appointment()
+        todays.start_time = today
+        later.start_time = today + timedelta(days=2)
+        self.ghl._fetch_appointments = AsyncMock(return_value=([todays, later], True))
+
+        assert len(await self.ghl.get_weeks_schedule()) == 2
+        assert await self.ghl.get_todays_schedule() == [todays]
+        assert self.ghl._fetch_appointments.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_incomplete_week_fetch_not_seeded(self):
+        """A weekly fetch missing a calendar leaves today's schedule to its own query."""
+        self.ghl._fetch_appointments = AsyncMock(return_value=([_appointment()], False))
+
+        await self.ghl.get_weeks_schedule()
+        await self.ghl.get_todays_schedule()
+
+        assert self.ghl._fetch_appointments.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_incomplete_fetch_not_cached(self):
+        """A schedule missing an errored calendar is served but re-queried next time."""
+        self.ghl._fetch_appointments = AsyncMock(return_value=([_appointment()], False))
+
+        assert len(await self.ghl.get_todays_schedule()) == 1
+        await self.ghl.get_todays_schedule()
+
+        assert self.ghl._fetch_appointments.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_callers_cannot_mutate_cache(self):
+        """Mutating a returned list leaves the cached schedule intact."""
+        result = await self.ghl.get_todays_schedule()
+        result.clear()
+
+        assert len(await self.ghl.get_todays_schedule()) == 1
+
+
+class TestContactCache:
+    """Test the TTL caches in front of contact resolution."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_id_lookup_hits_cache(self):
+        """A contact id already fetched within the TTL is not re-requested."""
+        ghl = GoHighLevelIntegration()
+        ghl._request = AsyncMock(return_value={"contact": {"id": "c1", "name": "Destiny"}})
+
+        await ghl._get_contact_by_id("c1")
+        contact = await ghl._get_contact_by_id("c1")
+
+        assert contact["name"] == "Destiny"
+        assert ghl._request.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_id_lookup_not_cached(self):
+        """Errors are retried on the next lookup rather than remembered."""
+        ghl = GoHighLevelIntegration()
+        ghl._request = AsyncMock(return_value={"error": "boom", "status_code": 404})
+
+        assert await ghl._get_contact_by_id("c1") is None
+        assert await ghl._get_contact_by_id("c1") is None
+        assert ghl._request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_name_miss_cached_case_insensitively(self):
+        """A search with no match is remembered too, keyed on the lowercased name."""
+        ghl = GoHighLevelIntegration()
+        ghl._request = AsyncMock(return_value={"contacts": []})
+
+        assert await ghl._search_contact_by_name("Destiny") is None
+        assert await ghl._search_contact_by_name("destiny") is None
+        assert ghl._request.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_refetches(self, monkeypatch):
+        """Entries older than the TTL are refreshed."""
+        ghl = GoHighLevelIntegration()
+        ghl._request = AsyncMock(return_value={"contact": {"id": "c1"}})
+
+        await ghl._get_contact_by_id("c1")
+        monkeypatch.setattr(ghl_mod, "CONTACT_CACHE_TTL", 0)
+        await ghl._get_contact_by_id("c1")
+
+        assert ghl._request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self):
+        """Callers racing on the same uncached contact wait on a single request."""
+        ghl = GoHighLevelIntegration()
+        release = asyncio.Event()
+
+        async def slow_request(*args, **kwargs):
+            await release.wait()
+            return {"contact": {"id": "c1", "name": "Destiny"}}
+
+        ghl._request = AsyncMock(side_effect=slow_request)
+        lookups = asyncio.gather(*(ghl._get_contact_by_id("c1") for _ in range(3)))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert [c["name"] for c in await lookups] == ["Destiny"] * 3
+        assert ghl._request.await_count == 1
+        assert not ghl._contact_lookups
+
+    def test_oldest_entry_evicted_when_full(self, monkeypatch):
+        """The cache stays bounded by dropping its oldest entry."""
+        monkeypatch.setattr(ghl_mod, "CONTACT_CACHE_MAX", 2)
+        cache = {}
+        for key in ("a", "b", "c"):
+            GoHighLevelIntegration._remember(cache, key, key)
+
+        assert list(cache) == ["b", "c"]
+
+
+class TestAppointmentOrdering:
+    """Test multi-calendar fetch ordering."""
+
+    def test_configured_calendars_presorted(self):
+        """The module-level snapshot covers every configured calendar in priority order."""
+        priorities = [cal["priority"] for cal in ghl_mod._CALENDARS_BY_PRIORITY]
+
+        assert priorities == sorted(priorities)
+        assert len(priorities) == len(ghl_mod.GHL_CALENDARS)
+
+    @pytest.mark.asyncio
+    async def test_multi_day_multi_calendar_is_chronological(self, monkeypatch):
+        """Results are in start-time order across days, not grouped by calendar."""
+        calendars = {
+            "walkthrough": {"id": "cal_walk", "name": "Walkthrough", "priority": 2, "focus": "lead"},
+            "cleaning": {"id": "cal_clean", "name": "Cleaning", "priority": 1, "focus": "clean"},
+        }
+        events = {
+            "cal_walk": [
+                {"id": "w2", "title": "Walk", "startTime": "2026-03-14T16:00:00Z"},
+                {"id": "w1", "title": "Walk", "startTime": "2026-03-13T08:00:00Z"},
+            ],
+            "cal_clean": [
+                {"id": "c2", "title": "Late", "startTime": "2026-03-14T15:00:00Z"},
+                {"id": "c1", "title": "Early", "startTime": "2026-03-13T09:00:00Z"},
+            ],
+        }
+        _use_calendars(monkeypatch, calendars)
+
+        ghl = GoHighLevelIntegration()
+        ghl._request = AsyncMock(side_effect=lambda *a, params=None, **k: {"events": events[params["calendarId"]]})
+        ghl._resolve_contact = AsyncMock(return_value=("Unknown", "", ""))
+
+        result = await ghl.get_appointments("2026-03-13", "2026-03-15")
+
+        assert [a.id for a in result] == ["w1", "c1", "c2", "w2"]
+        assert [a.start_time for a in result] == sorted(a.start_time for a in result)
+
+
+    @pytest.mark.asyncio
+    async def test_calendar_error_marks_fetch_incomplete(self, monkeypatch):
+        """An erroring calendar is skipped and flags the result as incomplete."""
+        _use_calendars(monkeypatch, {
+            "a": {"id": "cal_a", "name": "A", "priority": 1},
+            "b": {"id": "cal_b", "name": "B", "priority": 2},
+        })
+        responses = {
+            "cal_a": {"events": [{"id": "a1", "title": "Clean", "startTime": "2026-03-13T09:00:00Z"}]},
+            "cal_b": {"error": "boom", "status_code": 500},
+        }
+        ghl = GoHighLevelIntegration()
+        ghl._request = AsyncMock(side_effect=lambda *a, params=None, **k: responses[params["calendarId"]])
+        ghl._resolve_contact = AsyncMock(return_value=("Unknown", "", ""))
+
+        appointments, complete = await ghl._fetch_appointments("2026-03-13", "2026-03-14")
+
+        assert [a.id for a in appointments] == ["a1"]
+        assert complete is False
+
+
+class TestConcurrentCalendars:
+    """Test that calendar fetches overlap."""
+
+    @pytest.mark.asyncio
+    async def test_calendars_fetched_concurrently(self, monkeypatch):
+        """Every calendar request is in flight before any of them returns."""
+        calendars = {k: {"id": k, "name": k, "priority": i} for i, k in enumerate(("a", "b", "c"), 1)}
+        _use_calendars(monkeypatch, calendars)
+        in_flight, release = [], asyncio.Event()
+
+        async def fake_request(method, endpoint, params=None, **kwargs):
+            in_flight.append(params["calendarId"])
+            if len(in_flight) == len(calendars):
+                release.set()
+            await asyncio.wait_for(release.wait(), timeout=1)
+            return {"events": []}
+
+        ghl = GoHighLevelIntegration()
+        ghl._request = fake_request
+
+        assert await ghl.get_appointments("2026-03-13", "2026-03-14") == []
+        assert sorted(in_flight) == ["a", "b", "c"]
+
+
+class TestConcurrentEventParsing:
+    """Test that per-event contact resolution overlaps."""
+
+    @pytest.mark.asyncio
+    async def test_events_resolved_concurrently(self, monkeypatch):
+        """Contact lookups for one calendar's events run together; order is kept."""
+        _use_calendars(monkeypatch, {"c": {"id": "cal", "name": "Cleaning", "priority": 1}})
+        events = [
+            {"id": f"e{i}", "title": "Clean", "startTime": f"2026-03-13T1{i}:00:00Z", "contactId": f"c{i}"}
+            for i in range(3)
+        ]
+        pending, release = [], asyncio.Event()
+
+        async def fake_resolve(contact_id, title, embedded):
+            pending.append(contact_id)
+            if len(pending) == len(events):
+                release.set()
+            await asyncio.wait_for(release.wait(), timeout=1)
+            return contact_id, "", ""
+
+        ghl = GoHighLevelIntegration()
+        ghl._request = AsyncMock(return_value={"events": events})
+        ghl._resolve_contact = fake_resolve
+
+        result = await ghl.get_appointments("2026-03-13", "2026-03-14")
+
+        assert [a.contact_name for a in result] == ["c0", "c1", "c2"]
+
+
+class TestQueryWindow:
+    """Test the calendar query window sent to GHL."""
+
+    @pytest.mark.asyncio
+    async def test_single_day_window_is_central_time(self, monkeypatch):
+        """A bare date covers that whole day in Central Time, regardless of server TZ."""
+        _use_calendars(monkeypatch, {"c": {"id": "cal", "name": "Cleaning", "priority": 1}})
+        ghl = GoHighLevelIntegration()
+        ghl._request = AsyncMock(return_value={"events": []})
+
+        await ghl.get_appointments("2026-03-13", "2026-03-13")
+
+        params = ghl._request.await_args.kwargs["params"]
+        assert params["startTime"] == 1773378000000   # 2026-03-13 00:00 CDT
+        assert params["endTime"] == 1773464399000     # 2026-03-13 23:59:59 CDT
+
+    @pytest.mark.asyncio
+    async def test_datetime_bounds_used_directly(self, monkeypatch):
+        """Datetime bounds (as passed by get_todays_schedule) skip string parsing."""
+        _use_calendars(monkeypatch, {"c": {"id": "cal", "name": "Cleaning", "priority": 1}})
+        ghl = GoHighLevelIntegration()
+        ghl._request = AsyncMock(return_value={"events": []})
+        start = datetime(2026, 3, 13, tzinfo=ghl_mod.CENTRAL)
+
+        await ghl.get_appointments(start, start.replace(day=14))
+
+        params = ghl._request.await_args.kwargs["params"]
+        assert params["startTime"] == 1773378000000
+        assert params["endTime"] == 1773464400000
+
+
+class TestIsoParsing:
+    """Test GHL timestamp parsing."""
+
+    def test_trailing_z_is_utc(self):
+        """A 'Z' suffix parses as an aware UTC datetime."""
+        assert ghl_mod._parse_iso("2026-03-13T15:00:00Z") == datetime(2026, 3, 13, 15, tzinfo=timezone.utc)
+
+    def test_explicit_offset_kept(self):
+        """Offset timestamps keep their offset."""
+        parsed = ghl_mod._parse_iso("2026-03-13T09:00:00-05:00")
+        assert parsed.utcoffset() == timedelta(hours=-5)
+
+    def test_bad_contact_date_falls_back(self):
+        """A missing or malformed dateAdded doesn't drop the contact."""
+        ghl = GoHighLevelIntegration()
+        for raw in (None, "", "not-a-date"):
+            assert ghl._parse_contact({"id": "c1", "dateAdded": raw}).id == "c1"
+
+
+class TestTitleNameExtraction:
+    """Test contact-name extraction from appointment titles."""
+
+    @pytest.mark.parametrize("title,expected", [
+        ("Destiny - Recurring Cleaning", "Destiny"),
+        ("Cleaning for Sarah Johnson", "Sarah Johnson"),
+        ("Deep cleaning for Sarah Johnson", "Sarah Johnson"),
+        ("Smith Residence Deep Clean", "Smith"),
+        ("Sarah Johnson (biweekly)", "Sarah Johnson"),
+        ("Smith, John - Deep Clean", "Smith, John"),
+        ("appointment", "Unknown"),
+        (" Cleaning ", "Unknown"),
+        ("123 - 456", "Unknown"),
+        ("", "Unknown"),
+    ])
+    def test_extract_name_from_title(self, title, expected):
+        """First matching pattern wins; service words are rejected."""
+        assert GoHighLevelIntegration._extract_name_from_title(title) == expected
+
+    def test_repeat_titles_are_memoized(self):
+        """A title seen before is answered from the cache."""
+        extract = GoHighLevelIntegration._extract_name_from_title
+        extract.cache_clear()
+
+        extract("Destiny - Recurring Cleaning")
+        extract("Destiny - Recurring Cleaning")
+
+        assert extract.cache_info().hits == 1
+
+
+class TestRequestSpacing:
+    """Test the per-instance request rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_spaced(self, monkeypatch):
+        """Once the bucket is empty, concurrent callers reserve successive slots."""
+        delays = []
+
+        async def fake_sleep(seconds):
+            delays.append(seconds)
+
+        monkeypatch.setattr(ghl_mod.asyncio, "sleep", fake_sleep)
+        ghl = GoHighLevelIntegration()
+        ghl._burst = 1
+        ghl.session = _FakeSession()
+
+        await asyncio.gather(*(ghl._request("GET", "/locations/x") for _ in range(3)))
+
+        assert len(ghl.session.calls) == 3
+        assert len(delays) == 2
+        assert delays[0] == pytest.approx(ghl._min_interval, abs=0.05)
+        assert delays[1] == pytest.approx(2 * ghl._min_interval, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_burst_starts_immediately(self, monkeypatch):
+        """A full bucket lets RATE_LIMIT_BURST requests start without waiting."""
+        delays = []
+
+        async def fake_sleep(seconds):
+            delays.append(seconds)
+
+        monkeypatch.setattr(ghl_mod.asyncio, "sleep", fake_sleep)
+        ghl = GoHighLevelIntegration()
+        ghl.session = _FakeSession()
+
+        await asyncio.gather(*(ghl._request("GET", "/locations/x") for _ in range(ghl._burst + 1)))
+
+        assert len(ghl.session.calls) == ghl._burst + 1
+        assert len(delays) == 1
+        assert delays[0] == pytest.approx(ghl._min_interval, abs=0.05)
+
+
+class TestConcurrencyLimit:
+    """Test the in-flight request cap."""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_are_capped(self, monkeypatch):
+        """No more than MAX_CONCURRENT_REQUESTS requests are open at once."""
+        monkeypatch.setattr(ghl_mod, "MAX_CONCURRENT_REQUESTS", 2)
+        in_flight, peak = 0, 0
+
+        class _SlowResponse(_FakeResponse):
+            async def __aenter__(self):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                return self
+
+            async def __aexit__(self, *exc):
+                nonlocal in_flight
+                in_flight -= 1
+                return False
+
+        ghl = GoHighLevelIntegration()
+        ghl._min_interval = 0
+        ghl.session = _FakeSession([_SlowResponse() for _ in range(6)])
+
+        await asyncio.gather(*(ghl._request("GET", "/contacts/") for _ in range(6)))
+
+        assert len(ghl.session.calls) == 6
+        assert peak == 2
+
+
+class TestErrorResponses:
+    """Test error handling in _request."""
+
+    @pytest.mark.asyncio
+    async def test_error_body_is_truncated(self):
+        """Only a short prefix of an error body is read and returned."""
+        ghl = GoHighLevelIntegration()
+        ghl.session = _FakeSession([_FakeResponse(422, {"message": "x" * 10_000})])
+
+        result = await ghl._request("GET", "/contacts/")
+
+        assert result["status_code"] == 422
+        assert result["error"].startswith('{"message": "xxx')
+        assert len(result["error"]) == ghl_mod.ERROR_SNIPPET_BYTES
+
+    @pytest.mark.asyncio
+    async def test_unauthorized_retries_after_refresh(self):
+        """A 401 triggers one token refresh and a retry whose JSON is returned."""
+        ghl = GoHighLevelIntegration()
+        ghl.session = _FakeSession([_FakeResponse(401), _FakeResponse(200, {"ok": True})])
+        ghl._refresh_token = AsyncMock(return_value=True)
+
+        assert await ghl._request("GET", "/contacts/") == {"ok": True}
+        assert len(ghl.session.calls) == 2
+
+
+class TestRetries:
+    """Test backoff retries on transient GHL failures."""
+
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self, monkeypatch):
+        self.delays = []
+
+        async def fake_sleep(seconds):
+            self.delays.append(seconds)
+
+        monkeypatch.setattr(ghl_mod.asyncio, "sleep", fake_sleep)
+
+    @pytest.mark.asyncio
+    async def test_retries_server_errors_then_succeeds(self):
+        """A GET that hits 503 then 200 returns the successful body."""
+        ghl = GoHighLevelIntegration()
+        ghl.session = _FakeSession([_FakeResponse(503), _FakeResponse(200, {"ok": True})])
+
+        assert await ghl._request("GET", "/contacts/") == {"ok": True}
+        assert len(ghl.session.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_honours_retry_after(self):
+        """A 429 waits for the server's Retry-After before trying again."""
+        ghl = GoHighLevelIntegration()
+        ghl.session = _FakeSession([_FakeResponse(429, headers={"Retry-After": "2"}), _FakeResponse(200)])
+
+        await ghl._request("GET", "/contacts/")
+
+        assert 2.0 in self.delays
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        """Persistent failures return the last error after MAX_RETRIES retries."""
+        ghl = GoHighLevelIntegration()
+        ghl.session = _FakeSession([_FakeResponse(500) for _ in range(ghl_mod.MAX_RETRIES + 1)])
+
+        result = await ghl._request("GET", "/contacts/")
+
+        assert result["status_code"] == 500
+        assert len(ghl.session.calls) == ghl_mod.MAX_RETRIES + 1
+
+    @pytest.mark.asyncio
+    async def test_post_not_retried_on_server_error(self):
+        """Non-idempotent requests are not repeated after a 5xx."""
+        ghl = GoHighLevelIntegration()
+        ghl.session = _FakeSession([_FakeResponse(502), _FakeResponse(200)])
+
+        result = await ghl._request("POST", "/conversations/messages", data={"message": "hi"})
+
+        assert result["status_code"] == 502
+        assert len(ghl.session.calls) == 1
+
+
+class TestHeaderCache:
+    """Test per-version header reuse."""
+
+    def test_headers_reused_per_version(self):
+        """The same Version value returns the same read-only header set."""
+        ghl = GoHighLevelIntegration()
+
+        assert ghl._base_headers("2021-04-15") is ghl._base_headers("2021-04-15")
+        assert ghl._base_headers("2021-07-28")["Version"] == "2021-07-28"
+        with pytest.raises(TypeError):
+            ghl._base_headers("2021-04-15")["Authorization"] = "Bearer other"
+
+    @pytest.mark.asyncio
+    async def test_token_refresh_rebuilds_headers(self):
+        """After a 401 + refresh, the retry carries the new bearer token."""
+        ghl = GoHighLevelIntegration()
+        ghl.pit_token, ghl.api_key = None, None
+        ghl.oauth_access_token, ghl.oauth_refresh_token = "old", "refresh"
+        ghl.session = _FakeSession([
+            _FakeResponse(401),
+            _FakeResponse(200, {"access_token": "new"}),
+            _FakeResponse(200, {"ok": True}),
+        ])
+
+        assert await ghl._request("GET", "/contacts/") == {"ok": True}
+
+        first, _, retry = ghl.session.calls
+        assert first[2]["headers"]["Authorization"] == "Bearer old"
+        assert retry[2]["headers"]["Authorization"] == "Bearer new"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_401s_share_one_refresh(self):
+        """Requests that all hit an expired token trigger a single /oauth/token POST."""
+
+        class _YieldingResponse(_FakeResponse):
+            async def __aenter__(self):
+                await asyncio.sleep(0)  # let every request get on the wire first
+                return self
+
+        class _ExpiringSession(_FakeSession):
+            def request(self, method, url, **kwargs):
+                self.calls.append((method, url, kwargs))
+                if str(url).endswith("/oauth/token"):
+                    return _YieldingResponse(200, {"access_token": "new", "refresh_token": "refresh2"})
+                if kwargs["headers"]["Authorization"] == "Bearer old":
+                    return _YieldingResponse(401)
+                return _YieldingResponse(200, {"ok": True})
+
+        ghl = GoHighLevelIntegration()
+        ghl.pit_token, ghl.api_key = None, None
+        ghl.oauth_access_token, ghl.oauth_refresh_token = "old", "refresh"
+        ghl.session = _ExpiringSession()
+
+        results = await asyncio.gather(*(ghl._request("GET", f"/contacts/c{i}") for i in range(4)))
+
+        assert results == [{"ok": True}] * 4
+        refreshes = [c for c in ghl.session.calls if str(c[1]).endswith("/oauth/token")]
+        assert len(refreshes) == 1
+        assert ghl.oauth_refresh_token == "refresh2"
+
+
+class TestSessionLifecycle:
+    """Test pooled-session reuse across context-manager blocks."""
+
+    @pytest.mark.asyncio
+    async def test_persistent_instance_reuses_session(self):
+        """A persistent instance keeps one session open until aclose()."""
+        ghl = GoHighLevelIntegration(persistent=True)
+        async with ghl:
+            first = ghl.session
+        async with ghl:
+            second = ghl.session
+
+        assert first is second
+        assert not first.closed
+
+        await ghl.aclose()
+        assert first.closed
+        assert ghl.session is None
+
+    @pytest.mark.asyncio
+    async def test_default_instance_closes_on_exit(self):
+        """Non-persistent instances keep the old one-session-per-block behaviour."""
+        ghl = GoHighLevelIntegration()
+        async with ghl:
+            session = ghl.session
+
+        assert session.closed
+        assert ghl.session is None
+
+
+class TestEndpointUrls:
+    """Test prebuilt endpoint URLs."""
+
+    @pytest.mark.asyncio
+    async def test_request_uses_cached_url(self):
+        """Repeat requests to an endpoint reuse one parsed URL."""
+        ghl = GoHighLevelIntegration()
+        ghl.session = _FakeSession()
+
+        await ghl._request("GET", "/calendars/events", params={"calendarId": "a"})
+        await ghl._request("GET", "/calendars/events", params={"calendarId": "b"})
+
+        (_, first, _), (_, second, _) = ghl.session.calls
+        assert first is second
+        assert str(first) == "https://services.leadconnectorhq.com/calendars/events"
+
+    def test_id_paths_built_per_call(self):
+        """ID-bearing endpoints are joined onto the base URL, not cached."""
+        url = ghl_mod._endpoint_url("/contacts/abc123")
+
+        assert str(url) == "https://services.leadconnectorhq.com/contacts/abc123"
+        assert "/contacts/abc123" not in ghl_mod._STATIC_URLS
+
+
+class TestConnectionCheck:
+    """Test the test_connection diagnostic."""
+
+    @pytest.mark.asyncio
+    async def test_probes_run_concurrently(self):
+        """All four probes are in flight before any of them returns."""
+        started, release = [], asyncio.Event()
+
+        def probe(name, value):
+            async def run(*args, **kwargs):
+                started.append(name)
+                if len(started) == 4:
+                    release.set()
+                await asyncio.wait_for(release.wait(), timeout=1)
+                return value
+            return run
+
+        ghl = GoHighLevelIntegration()
+        ghl._request = probe("location", {"location": {}})
+        ghl._fetch_appointments = probe("calendar", ([_appointment()], True))
+        ghl.search_contacts = probe("contacts", [])
+        ghl.get_conversations = probe("conversations", [])
+
+        result = await ghl.test_connection()
+
+        assert result["status"] == "success"
+        assert result["todays_appointments"] == 1
+        assert sorted(started) == ["calendar", "contacts", "conversations", "location"]
+
+    @pytest.mark.asyncio
+    async def test_failure_keeps_earlier_results(self):
+        """A failing probe reports an error but keeps the probes before it."""
+        ghl = GoHighLevelIntegration()
+        ghl._request = AsyncMock(return_value={"location": {}})
+        ghl._fetch_appointments = AsyncMock(return_value=([], True))
+        ghl.search_contacts = AsyncMock(side_effect=RuntimeError("boom"))
+        ghl.get_conversations = AsyncMock(return_value=[])
+
+        result = await ghl.test_connection()
+
+        assert result["status"] == "error"
+        assert result["error"] == "boom"
+        assert result["calendar_ok"] is True
+        assert "contacts_ok" not in result
+
+    @pytest.mark.asyncio
+    async def test_calendar_probe_bypasses_schedule_cache(self):
+        """The calendar probe queries GHL even when today's schedule is cached."""
+        ghl = GoHighLevelIntegration()
+        ghl._schedule_cache = (ghl_mod.now_ct().date(), ghl_mod.time.monotonic(), [_appointment()])
+        ghl._request = AsyncMock(return_value={"location": {}})
+        ghl._fetch_appointments = AsyncMock(return_value=([], False))
+        ghl.search_contacts = AsyncMock(return_value=[])
+        ghl.get_conversations = AsyncMock(return_value=[])
+
+        result = await ghl.test_connection()
+
+        assert ghl._fetch_appointments.await_count == 1
+        assert result["calendar_ok"] is False
+        assert result["todays_appointments"] == 0
+
+    @staticmethod
+    def _mocked(location=None):
+        ghl = GoHighLevelIntegration()
+        ghl._request = AsyncMock(return_value=location if location is not None else {"location": {}})
+        ghl._fetch_appointments = AsyncMock(return_value=([], True))
+        ghl.search_contacts = AsyncMock(return_value=[])
+        ghl.get_conversations = AsyncMock(return_value=[])
+        return ghl
+
+    @pytest.mark.asyncio
+    async def test_success_is_cached(self):
+        """A repeat check within the TTL reuses the last success without probing."""
+        ghl = self._mocked()
+
+        first = await ghl.test_connection()
+        first["status"] = "mutated"
+        second = await ghl.test_connection()
+
+        assert second["status"] == "success"
+        assert ghl._request.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_partial_result_not_cached(self):
+        """Anything short of success is re-probed next time."""
+        ghl = self._mocked(location={"error": "not found", "status_code": 404})
+
+        assert (await ghl.test_connection())["status"] == "partial"
+        await ghl.test_connection()
+
+        assert ghl._request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_calendar_probe_not_cached(self):
+        """A success with a calendar that didn't answer is re-probed next time."""
+        ghl = self._mocked()
+        ghl._fetch_appointments = AsyncMock(return_value=([], False))
+
+        assert (await ghl.test_connection())["status"] == "success"
+        await ghl.test_connection()
+
+        assert ghl._request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_auth_error_drops_cached_success(self):
+        """A 401/403 seen by any later request forces a fresh probe."""
+        ghl = self._mocked()
+        await ghl.test_connection()
+
+        ghl._note_error_status(404)
+        await ghl.test_connection()
+        assert ghl._request.await_count == 1
+
+        ghl._note_error_status(403)
+        await ghl.test_connection()
+        assert ghl._request.await_count == 2
@@ -0,0 +1,100 @@
+"""
+Unit tests for shared Pydantic schemas
+"""
+
+import pytest
+from datetime import datetime
+from decimal import Decimal
+
+from src.models.types import ServiceType
+from src.models.schemas import BaseSchema, JobSchema, PerformanceMetrics, PricingRequest
+
+
+class TestPricingRequestAddOns:
+    """Test add-on validation on PricingRequest."""
+
+    def test_valid_add_ons_pass(self):
+        """Known add-ons are accepted unchanged."""
+        request = PricingRequest(
+            service_type="prestige", rooms=3, full_baths=2, half_baths=0,
+            add_ons=["fridge_interior", "oven_interior"],
+        )
+        assert request.add_ons == ["fridge_interior", "oven_interior"]
+
+    def test_none_becomes_empty_list(self):
+        """An explicit None normalizes to an empty list."""
+        request = PricingRequest(service_type="prestige", rooms=1, full_baths=1, half_baths=0, add_ons=None)
+        assert request.add_ons == []
+
+    def test_invalid_add_ons_rejected(self):
+        """Every unknown add-on is reported."""
+        with pytest.raises(ValueError, match="bogus, hot_tub"):
+            PricingRequest(
+                service_type="prestige", rooms=1, full_baths=1, half_baths=0,
+                add_ons=["hot_tub", "fridge_interior", "bogus"],
+            )
+
+
+class TestNumericFields:
+    """Test the Decimal/float split between money and statistics."""
+
+    def test_rates_are_float_money_is_decimal(self):
+        """Rates coerce to float while revenue keeps exact Decimal precision."""
+        metrics = PerformanceMetrics(
+            contractor_id="c1", week_ending=datetime(2026, 3, 13),
+            checklist_compliance_rate="97.5", photo_submission_rate=100, on_time_percentage=Decimal("92.3"),
+            jobs_completed=12, total_revenue_generated="5826.10", violation_count=0,
+        )
+
+        assert isinstance(metrics.on_time_percentage, float)
+        assert metrics.checklist_compliance_rate == 97.5
+        assert metrics.total_revenue_generated == Decimal("5826.10")
+
+
+class TestDeferredBuild:
+    """Test that schema compilation is deferred until first use."""
+
+    def test_schema_builds_on_first_validation(self):
+        """A freshly defined schema is incomplete until it validates something."""
+        class _Probe(BaseSchema):
+            name: str
+
+        assert not _Probe.__pydantic_complete__
+        assert _Probe(name="x").name == "x"
+        assert _Probe.__pydantic_complete__
+
+
+class TestFrozenSchemas:
+    """Test which schemas are immutable after construction."""
+
+    def test_request_is_frozen(self):
+        """Read-only schemas reject attribute assignment."""
+        request = PricingRequest(service_type="prestige", rooms=1, full_baths=1, half_baths=0)
+        with pytest.raises(ValueError):
+            request.rooms = 5
+
+    def test_job_stays_mutable(self):
+        """Lifecycle records still accept validated updates."""
+        job = JobSchema(
+            id="job_1", service_type="prestige", status="scheduled", client_name="Destiny",
+            address="123 Main St", scheduled_date=datetime(2026, 3, 13),
+            base_price=Decimal("449.00"), final_price=Decimal("485.48"),
+        )
+        job.status = "completed"
+        assert job.status == "completed"
+
+
+class TestLiteralServiceType:
+    """Test Literal-typed service_type / status fields."""
+
+    def test_accepts_enum_and_string(self):
+        """Enum members and raw strings both validate to the plain value."""
+        from_enum = PricingRequest(service_type=ServiceType.PRESTIGE, rooms=1, full_baths=1, half_baths=0)
+        from_str = PricingRequest(service_type="prestige", rooms=1, full_baths=1, half_baths=0)
+
+        assert from_enum.service_type == from_str.service_type == "prestige"
+
+    def test_rejects_unknown_service_type(self):
+        """Values outside ServiceType are rejected."""
+        with pytest.raises(ValueError):
+            PricingRequest(service_type="window_washing", rooms=1, full_baths=1, half_baths=0)
@@ -0,0 +1,54 @@
+"""
+Unit tests for the GHL webhook server
+"""
+
+import orjson
+import pytest
+
+from src.api import webhook_server
+
+
+class _FakeRequest:
+    """Minimal Starlette request stand-in."""
+
+    def __init__(self, payload: dict):
+        self._body = orjson.dumps(payload)
+
+    async def body(self) -> bytes:
+        return self._body
+
+
+class _FakeGHL:
+    """Records schedule invalidations."""
+
+    def __init__(self):
+        self.invalidations = 0
+
+    def invalidate_schedule(self):
+        self.invalidations += 1
+
+
+class TestScheduleInvalidation:
+    """Test that appointment events drop Ava's cached schedule."""
+
+    @pytest.fixture(autouse=True)
+    def ghl(self, monkeypatch):
+        fake = _FakeGHL()
+        monkeypatch.setattr(webhook_server, "get_gohighlevel_integration", lambda: fake)
+        monkeypatch.setattr(webhook_server, "_router", None)
+        return fake
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("event", ["AppointmentCreate", "AppointmentUpdate", "AppointmentDelete"])
+    async def test_appointment_events_invalidate(self, ghl, event):
+        """Appointment events clear the cache even before the router is ready."""
+        await webhook_server.ghl_webhook(_FakeRequest({"type": event, "appointment": {}}))
+
+        assert ghl.invalidations == 1
+
+    @pytest.mark.asyncio
+    async def test_message_events_keep_cache(self, ghl):
+        """Inbound messages leave the cached schedule alone."""
+        await webhook_server.ghl_webhook(_FakeRequest({"type": "InboundMessage", "message": {}}))
+
+        assert ghl.invalidations == 0